@@ -20,6 +20,7 @@ from sqlalchemy import (
     PrimaryKeyConstraint,
     func,
     select,
+    text,
 )
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, JSONB, TEXT, TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
@@ -127,6 +128,8 @@ class Workspace(SQLModel, table=True):
     graphs: list["Graph"] = Relationship(back_populates="workspace")
     folders: list["Folder"] = Relationship(back_populates="workspace")
 
+    __table_args__ = (Index("idx_workspaces_user_id", "user_id"),)
+
 
 class Folder(SQLModel, table=True):
     __tablename__ = "folders"
@@ -179,6 +182,8 @@ class Folder(SQLModel, table=True):
     graphs: list["Graph"] = Relationship(back_populates="folder")
     workspace: Optional[Workspace] = Relationship(back_populates="folders")
 
+    __table_args__ = (Index("idx_folders_workspace_id", "workspace_id"),)
+
 
 class Graph(SQLModel, table=True):
     __tablename__ = "graphs"
@@ -284,7 +289,17 @@ class Graph(SQLModel, table=True):
     def node_count(self, value: Optional[int]) -> None:
         self._node_count = value
 
-    __table_args__ = (Index("idx_graphs_user_updated_at", "user_id", "updated_at"),)
+    __table_args__ = (
+        Index("idx_graphs_user_updated_at", "user_id", "updated_at"),
+        Index(
+            "idx_graphs_user_history",
+            "user_id",
+            text("updated_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("temporary IS FALSE"),
+        ),
+        Index("idx_graphs_workspace_id", "workspace_id"),
+    )
 
 
 class Node(SQLModel, table=True):
@@ -656,6 +671,9 @@ class TemplateBookmark(SQLModel, table=True):
         sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False),
     )
 
+    # The composite primary key leads with user_id, so only template_id needs its own index
+    __table_args__ = (Index("idx_template_bookmarks_template_id", "template_id"),)
+
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
@@ -742,7 +760,7 @@ class VerificationToken(SQLModel, table=True):
             nullable=False,
         ),
     )
-    email: str = Field(index=True, nullable=False)
+    email: str = Field(nullable=False)
     code: str = Field(max_length=6, nullable=False)
     expires_at: datetime.datetime = Field(
         sa_column=Column(TIMESTAMP(timezone=True), nullable=False)
@@ -758,7 +776,12 @@ class VerificationToken(SQLModel, table=True):
 
     __table_args__ = (
         Index("idx_verification_tokens_user_id", "user_id"),
-        Index("idx_verification_tokens_email", "email"),
+        Index(
+            "idx_verification_tokens_email_code",
+            "email",
+            "code",
+            postgresql_include=["user_id", "expires_at"],
+        ),
     )
 
 
@@ -903,9 +926,7 @@ class Files(SQLModel, table=True):
     size: Optional[int] = Field(default=None, sa_column=Column(DOUBLE_PRECISION, nullable=True))
     content_type: Optional[str] = Field(default=None, sa_column=Column(TEXT, nullable=True))
     storage_provider: str = Field(default="local", max_length=50, nullable=False)
-    content_hash: Optional[str] = Field(
-        default=None, sa_column=Column(TEXT, nullable=True, index=True)
-    )
+    content_hash: Optional[str] = Field(default=None, sa_column=Column(TEXT, nullable=True))
 
     created_at: datetime.datetime = Field(
         default_factory=datetime.datetime.now,
@@ -925,7 +946,15 @@ class Files(SQLModel, table=True):
         ),
     )
 
-    __table_args__ = (Index("idx_files_user_parent", "user_id", "parent_id"),)
+    __table_args__ = (
+        Index("idx_files_user_parent", "user_id", "parent_id"),
+        Index(
+            "idx_files_content_hash",
+            "content_hash",
+            postgresql_using="hash",
+            postgresql_where=text("content_hash IS NOT NULL"),
+        ),
+    )
 
 
 class ImageGenerationJob(SQLModel, table=True):
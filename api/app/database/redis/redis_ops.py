@@ -13,6 +13,8 @@ ANNOTATIONS_TTL_SECONDS = int(os.getenv("REDIS_ANNOTATIONS_TTL_SECONDS", 30 * 24
 PENDING_TOOL_CONTINUATION_TTL_SECONDS = int(
     os.getenv("REDIS_PENDING_TOOL_CONTINUATION_TTL_SECONDS", 24 * 60 * 60)
 )
+# Default TTL for extracted web pages: 1 day
+PAGE_EXTRACTION_TTL_SECONDS = int(os.getenv("REDIS_PAGE_EXTRACTION_TTL_SECONDS", 24 * 60 * 60))
 
 
 class RedisManager:
@@ -185,3 +187,43 @@ class RedisManager:
         except Exception as e:
             logger.error(f"Redis DEL (pending_tool_continuation) failed for key {key}: {e}")
             sentry_sdk.capture_exception(e)
+
+    async def get_page_extraction(self, url_hash: str) -> dict[str, Any] | None:
+        """
+        Retrieves a cached web page extraction.
+
+        Args:
+            url_hash (str): The SHA-256 hash of the requested URL.
+
+        Returns:
+            dict[str, Any] | None: The deserialized extraction, or None if not found.
+        """
+        if not url_hash:
+            return None
+        key = f"page_extraction:{url_hash}"
+        try:
+            cached_data = await self.client.get(key)
+            if cached_data:
+                return json.loads(cached_data)  # type: ignore[no-any-return]
+        except Exception as e:
+            logger.error(f"Redis GET (page_extraction) failed for key {key}: {e}")
+            sentry_sdk.capture_exception(e)
+        return None
+
+    async def set_page_extraction(self, url_hash: str, extraction: dict[str, Any]):
+        """
+        Serializes and stores a web page extraction.
+
+        Args:
+            url_hash (str): The SHA-256 hash of the requested URL.
+            extraction (dict[str, Any]): The extracted Markdown and navigation links.
+        """
+        if not url_hash:
+            return
+        key = f"page_extraction:{url_hash}"
+        try:
+            serialized_data = json.dumps(extraction)
+            await self.client.set(key, serialized_data, ex=PAGE_EXTRACTION_TTL_SECONDS)
+        except Exception as e:
+            logger.error(f"Redis SET (page_extraction) failed for key {key}: {e}")
+            sentry_sdk.capture_exception(e)
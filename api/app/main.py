@@ -42,6 +42,9 @@ from services.openrouter import OpenRouterReq, list_available_models
 from services.providers.models_dev import fetch_models_dev_catalog
 from services.rate_limit import limiter
 from services.web.browser_fetch import browser_fetch_manager
+from services.web.html_conversion import html_conversion_pool
+from services.web.http_fetch import fetch_session_manager
+from services.web.page_cache import page_extraction_cache
 from slowapi.errors import RateLimitExceeded
 from slowapi.extension import _rate_limit_exceeded_handler
 from slowapi.middleware import SlowAPIMiddleware
@@ -194,7 +197,9 @@ async def lifespan(app: FastAPI):
         if not app.state.master_open_router_api_key:
             raise ValueError("MASTER_OPEN_ROUTER_API_KEY is not set")
 
-        limits = httpx.Limits(max_connections=500, max_keepalive_connections=50)
+        limits = httpx.Limits(
+            max_connections=500, max_keepalive_connections=50, keepalive_expiry=30.0
+        )
         timeout = httpx.Timeout(120.0, connect=10.0, read=60.0)
         app.state.http_client = httpx.AsyncClient(timeout=timeout, limits=limits, http2=True)
         app.state.git_http_client = httpx.AsyncClient(timeout=timeout, limits=limits, http2=False)
@@ -205,6 +210,8 @@ async def lifespan(app: FastAPI):
             password=os.getenv("REDIS_PASSWORD", None),
         )
 
+        page_extraction_cache.start(app.state.redis_manager)
+
         app.state.connection_manager = connection_manager
         await app.state.connection_manager.start(app.state.redis_manager)
 
@@ -237,6 +244,9 @@ async def lifespan(app: FastAPI):
         await shutdown_background_tasks(app.state.background_tasks)
         await connection_manager.close()
         await browser_fetch_manager.close()
+        await fetch_session_manager.close()
+        await html_conversion_pool.close()
+        page_extraction_cache.close()
 
         if app.state.http_client is not None:
             await app.state.http_client.aclose()
@@ -410,6 +410,27 @@ def _merge_reasoning_detail_chunks(reasoning_detail_chunks: list[dict]) -> list[
     return [merged_by_key[key] for key in ordered_keys]
 
 
+def _parse_tool_arguments(tool_call: dict[str, Any]) -> dict[str, Any]:
+    arguments_str = tool_call["function"]["arguments"]
+    try:
+        return json.loads(arguments_str) if arguments_str else {}
+    except json.JSONDecodeError:
+        return {}
+
+
+async def _run_tool_handler(function_name: str, arguments: dict[str, Any], req) -> tuple[Any, int]:
+    started_at = time.perf_counter()
+    try:
+        tool_result = await TOOL_HANDLERS_BY_NAME[function_name](arguments, req)
+    except Exception as e:
+        tool_result = (
+            {"error": "Image inspection failed safely."}
+            if function_name == INSPECT_IMAGE_TOOL_NAME
+            else {"error": f"Tool execution failed: {str(e)}"}
+        )
+    return tool_result, int((time.perf_counter() - started_at) * 1000)
+
+
 async def _process_tool_calls_and_continue(
     tool_call_chunks,
     messages,
@@ -506,14 +527,32 @@ async def _process_tool_calls_and_continue(
                 )
         return public_tool_call_id
 
+    # Web tools are independent network I/O, so run them together before the ordered pass
+    # below, which consumes their results in call order.
+    web_call_indices = [
+        index
+        for index, tool_call in enumerate(function_tool_calls)
+        if tool_call["function"]["name"] in WEB_TOOL_NAMES
+        and tool_call["function"]["name"] in TOOL_HANDLERS_BY_NAME
+    ]
+    concurrent_results: dict[int, tuple[Any, int]] = {}
+    if web_call_indices:
+        web_results = await asyncio.gather(
+            *(
+                _run_tool_handler(
+                    function_tool_calls[index]["function"]["name"],
+                    _parse_tool_arguments(function_tool_calls[index]),
+                    req,
+                )
+                for index in web_call_indices
+            )
+        )
+        concurrent_results = dict(zip(web_call_indices, web_results))
+
     for index, tool_call in enumerate(function_tool_calls):
         function_name = tool_call["function"]["name"]
         runtime = get_tool_runtime(function_name)
-        arguments_str = tool_call["function"]["arguments"]
-        try:
-            arguments = json.loads(arguments_str) if arguments_str else {}
-        except json.JSONDecodeError:
-            arguments = {}
+        arguments = _parse_tool_arguments(tool_call)
 
         if function_name == INSPECT_IMAGE_TOOL_NAME and has_ask_user_call:
             tool_result = {
@@ -530,20 +569,13 @@ async def _process_tool_calls_and_continue(
                 "file_id": str(arguments.get("file_id") or ""),
             }
             duration_ms = 0
+        elif index in concurrent_results:
+            tool_result, duration_ms = concurrent_results[index]
         elif function_name not in TOOL_HANDLERS_BY_NAME:
             tool_result = {"error": f"Unknown tool: {function_name}"}
             duration_ms = 0
         else:
-            started_at = time.perf_counter()
-            try:
-                tool_result = await TOOL_HANDLERS_BY_NAME[function_name](arguments, req)
-            except Exception as e:
-                tool_result = (
-                    {"error": "Image inspection failed safely."}
-                    if function_name == INSPECT_IMAGE_TOOL_NAME
-                    else {"error": f"Tool execution failed: {str(e)}"}
-                )
-            duration_ms = int((time.perf_counter() - started_at) * 1000)
+            tool_result, duration_ms = await _run_tool_handler(function_name, arguments, req)
 
         tool_result, result_images = unwrap_tool_execution_result(tool_result)
         if result_images and resolve_tool_status(tool_result) != ToolCallStatusEnum.ERROR:
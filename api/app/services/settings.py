@@ -46,7 +46,9 @@ async def get_user_settings(pg_engine: AsyncEngine, user_id: str) -> SettingsDTO
     """
     settings_db = await get_settings(pg_engine, user_id)
     if not settings_db:
-        settings = DEFAULT_SETTINGS
+        # DEFAULT_SETTINGS is shared and callers edit nested lists in place, so hand out
+        # a private deep copy
+        settings = DEFAULT_SETTINGS.model_copy(deep=True)
     else:
         settings = SettingsDTO.model_validate(settings_db)
 
@@ -1,5 +1,6 @@
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from html import escape
 from typing import Any, Awaitable, Callable
 
@@ -448,12 +449,20 @@ WEB_TOOL_NAMES = {"web_search", "fetch_page_content"}
 def get_openrouter_tools(
     selected_tools: list[ToolEnum], *, include_image_inspection: bool = False
 ) -> list[ToolDefinition]:
+    return list(_resolve_openrouter_tools(tuple(selected_tools), include_image_inspection))
+
+
+@lru_cache(maxsize=64)
+def _resolve_openrouter_tools(
+    selected_tools: tuple[ToolEnum, ...], include_image_inspection: bool
+) -> tuple[ToolDefinition, ...]:
+    # Tool schemas are static, so each tool selection only needs to be flattened once
     tools: list[ToolDefinition] = []
     for tool in selected_tools:
         tools.extend(TOOLS_BY_ENUM.get(tool, []))
     if include_image_inspection and ToolEnum.IMAGE_GENERATION in selected_tools:
         tools.extend(RUNTIME_DEFINITIONS["inspect_image"].tool_definitions)
-    return tools
+    return tuple(tools)
 
 
 def get_tool_runtime(tool_name: str) -> ToolRuntimeDefinition | None:
@@ -1,8 +1,10 @@
+import asyncio
 from typing import TypeGuard
 
 from services.web.web_search import fetch_page, search_web
 
 MAX_WEB_TOOL_BATCH_SIZE = 5
+MAX_CONCURRENT_PAGE_FETCHES = 3
 
 WEB_SEARCH_TOOL = {
     "type": "function",
@@ -113,9 +115,18 @@ async def fetch_page_content(arguments: dict, req):
     if not _is_valid_batch(urls):
         return {"error": "'urls' must be an array containing 1 to 5 non-empty strings."}
 
-    pages = []
-    failed_count = 0
-    for url in urls:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGE_FETCHES)
+    pages = await asyncio.gather(*(_fetch_batch_page(url, req, semaphore) for url in urls))
+    failed_count = sum(1 for page in pages if "error" in page)
+
+    response: dict[str, object] = {"pages": pages}
+    if failed_count == len(urls):
+        response["error"] = "All page fetch operations failed."
+    return response
+
+
+async def _fetch_batch_page(url: str, req, semaphore: asyncio.Semaphore) -> dict[str, str]:
+    async with semaphore:
         try:
             page = await fetch_page(
                 url=url,
@@ -123,19 +134,11 @@ async def fetch_page_content(arguments: dict, req):
                 pg_engine=req.pg_engine,
                 user_id=req.user_id,
             )
-            if isinstance(page, dict) and page.get("error"):
-                pages.append({"url": url, "error": page["error"]})
-                failed_count += 1
-            else:
-                pages.append({"url": url, "markdown_content": page["markdown_content"]})
         except Exception:
-            pages.append({"url": url, "error": "Page fetch operation failed."})
-            failed_count += 1
-
-    response: dict[str, object] = {"pages": pages}
-    if failed_count == len(urls):
-        response["error"] = "All page fetch operations failed."
-    return response
+            return {"url": url, "error": "Page fetch operation failed."}
+    if isinstance(page, dict) and page.get("error"):
+        return {"url": url, "error": page["error"]}
+    return {"url": url, "markdown_content": page["markdown_content"]}
 
 
 def _is_valid_batch(items: object) -> TypeGuard[list[str]]:
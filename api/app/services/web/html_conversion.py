@@ -0,0 +1,92 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+logger = logging.getLogger("uvicorn.error")
+
+WORKERS_ENV = "LINK_EXTRACTION_HTML_WORKERS"
+DEFAULT_MAX_WORKERS = 4
+
+T = TypeVar("T")
+
+# Forking a process that already runs an event loop and worker threads can copy held locks
+# into the child, so workers always start from a fresh interpreter.
+_spawn_process_pool = partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn"))
+_POOL_UNAVAILABLE_ERRORS = (NotImplementedError, OSError, ImportError)
+
+
+class HtmlConversionPool:
+    """Lazy process pool that keeps CPU-bound HTML parsing off the event loop."""
+
+    def __init__(
+        self,
+        *,
+        executor_factory: Callable[..., Executor] = _spawn_process_pool,
+        env_getter: Callable[[str, str], str] = os.getenv,
+    ) -> None:
+        self._executor_factory = executor_factory
+        self._env_getter = env_getter
+        self._executor: Executor | None = None
+
+    def _max_workers(self) -> int:
+        default = min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+        try:
+            workers = int(self._env_getter(WORKERS_ENV, "") or default)
+        except ValueError:
+            workers = default
+        return max(1, workers)
+
+    def _use_threads(self, error: BaseException) -> Executor:
+        logger.warning(
+            "Process pool unavailable for HTML conversion (%s); using threads",
+            type(error).__name__,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers(), thread_name_prefix="html-conversion"
+        )
+        return self._executor
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            try:
+                self._executor = self._executor_factory(max_workers=self._max_workers())
+            except _POOL_UNAVAILABLE_ERRORS as error:
+                return self._use_threads(error)
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a picklable module-level function in the pool and await its result."""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        try:
+            # Process pools start their workers on first submit, which is where a missing
+            # sem_open or a process limit usually surfaces
+            future = loop.run_in_executor(executor, func, *args)
+        except _POOL_UNAVAILABLE_ERRORS as error:
+            if self._executor is executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._use_threads(error)
+            executor = self._get_executor()
+            future = loop.run_in_executor(executor, func, *args)
+        try:
+            return await future
+        except BrokenProcessPool:
+            logger.warning("HTML conversion process pool broke; recreating it")
+            if self._executor is executor:
+                self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+            return await asyncio.to_thread(func, *args)
+
+    async def close(self) -> None:
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+
+html_conversion_pool = HtmlConversionPool()
@@ -1,10 +1,14 @@
+import asyncio
 import logging
 import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from enum import Enum
-from typing import Mapping
+from typing import Any, Callable, Mapping
 from urllib.parse import quote, unquote, urlsplit, urlunsplit
 
 import sentry_sdk
+from curl_cffi import CurlHttpVersion
 from curl_cffi.requests import AsyncSession
 from curl_cffi.requests.exceptions import ConnectionError, ProxyError, RequestException, Timeout
 from services.web.reddit import _is_reddit_structured_url
@@ -12,11 +16,17 @@ from services.web.reddit import _is_reddit_structured_url
 logger = logging.getLogger("uvicorn.error")
 
 MIN_HTML_LENGTH = 2000
+IMPERSONATE_PROFILE = "chrome120"
+FETCH_TIMEOUT_SECONDS = 20
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+MAX_CONCURRENT_FETCHES = 64
+MAX_CONCURRENT_FETCHES_PER_HOST = 4
 CHALLENGE_BODY_SCAN_LENGTH = 8192
 MAX_HEADER_COUNT = 12
 MAX_HEADER_VALUE_LENGTH = 256
 MAX_HEADERS_TOTAL_LENGTH = 2048
 
+_TEXTUAL_CONTENT_TYPE_MARKERS = ("html", "xml", "json")
 _ALLOWED_HEADERS = {
     "content-type",
     "server",
@@ -37,6 +47,8 @@ _LONG_TOKEN_RE = re.compile(r"\b[A-Za-z0-9._~-]{24,}\b")
 _CONTROL_RE = re.compile(r"[\x00-\x1f\x7f]+")
 _WHITESPACE_RE = re.compile(r"\s+")
 _PATH_ASSIGNMENT_RE = re.compile(rf"(?i)(?:^|[-_.]){_SECRET_NAME}(?:[-_.:=]|$)")
+_JS_CHALLENGE_RE = re.compile(r"(?i)please enable js and disable any ad blocker")
+_CMSG_MARKER_RE = re.compile(r"(?i)id=\"cmsg\"|id='cmsg'|#cmsg")
 
 
 class FetchDecision(str, Enum):
@@ -181,15 +193,14 @@ def is_browser_challenge(
 ) -> bool:
     if status_code not in {401, 403}:
         return False
-    sample = str(body)[:CHALLENGE_BODY_SCAN_LENGTH].lower()
-    if "please enable js and disable any ad blocker" in sample:
+    sample = str(body)[:CHALLENGE_BODY_SCAN_LENGTH]
+    if _JS_CHALLENGE_RE.search(sample):
         return True
     lambda_response = any(
         str(name).lower() == "x-cache" and "lambdageneratedresponse" in str(value).lower()
         for name, value in (headers or {}).items()
     )
-    cmsg_marker = any(marker in sample for marker in ('id="cmsg"', "id='cmsg'", "#cmsg"))
-    return lambda_response and cmsg_marker
+    return lambda_response and _CMSG_MARKER_RE.search(sample) is not None
 
 
 def classify_status(
@@ -235,20 +246,186 @@ def _log_response_failure(
     logger.warning("HTTP fetch rejected response: %s", diagnostics)
 
 
-async def fetch_http_once(session: AsyncSession, url: str, proxy: str | None = None) -> str:
+def is_textual_content_type(headers: Mapping[object, object] | None) -> bool:
+    """Return whether a response may carry markup or text; a missing header is allowed."""
+    content_type = ""
+    for name, value in (headers or {}).items():
+        if str(name).lower() == "content-type":
+            content_type = str(value).split(";", 1)[0].strip().lower()
+            break
+    if not content_type:
+        return True
+    return content_type.startswith("text/") or any(
+        marker in content_type for marker in _TEXTUAL_CONTENT_TYPE_MARKERS
+    )
+
+
+async def _close_stream(response: object) -> None:
+    """Abort an unfinished streamed transfer and wait for curl to release the handle."""
+    quit_now = getattr(response, "quit_now", None)
+    if quit_now is not None:
+        quit_now.set()
+    aclose = getattr(response, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+async def _read_capped_body(response: Any, max_bytes: int) -> str:
+    """Read a streamed body up to ``max_bytes`` and decode it once."""
+    buffer = bytearray()
+    async for chunk in response.aiter_content():
+        buffer.extend(chunk)
+        if len(buffer) >= max_bytes:
+            # The caller's finally closes the stream and aborts the rest of the transfer
+            del buffer[max_bytes:]
+            break
+    try:
+        return buffer.decode(response.encoding, errors="replace")
+    except LookupError:
+        return buffer.decode("utf-8", errors="replace")
+
+
+class _HostSlots:
+    __slots__ = ("semaphore", "users")
+
+    def __init__(self) -> None:
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES_PER_HOST)
+        self.users = 0
+
+
+class _LoopSemaphore:
+    """Semaphore created lazily for the running loop and replaced when the loop changes."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> asyncio.Semaphore:
+        # asyncio primitives bind to the first loop that waits on them, so a new loop
+        # (scripts, tests, a lifespan restart) gets a fresh semaphore.
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._limit)
+            self._loop = loop
+        return self._semaphore
+
+
+_host_slots: dict[str, _HostSlots] = {}
+_fetch_slots = _LoopSemaphore(MAX_CONCURRENT_FETCHES)
+
+
+def _host_key(url: str) -> str:
+    try:
+        return (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+@asynccontextmanager
+async def host_fetch_slot(url: str) -> AsyncIterator[None]:
+    """Limit concurrent fetches per host; idle hosts are dropped from the registry."""
+    host = _host_key(url)
+    slots = _host_slots.get(host)
+    if slots is None:
+        slots = _host_slots[host] = _HostSlots()
+    slots.users += 1
+    try:
+        async with slots.semaphore:
+            yield
+    finally:
+        slots.users -= 1
+        if slots.users == 0 and _host_slots.get(host) is slots:
+            del _host_slots[host]
+
+
+def create_fetch_session() -> AsyncSession:
+    """Create a curl-cffi session pinned to the fetch fingerprint and request defaults.
+
+    HTTPS origins negotiate HTTP/2 so concurrent fetches to one host multiplex over a
+    single connection, and the curl handle pool matches the global fetch limit.
+    """
+    return AsyncSession(
+        impersonate=IMPERSONATE_PROFILE,
+        timeout=FETCH_TIMEOUT_SECONDS,
+        allow_redirects=True,
+        http_version=CurlHttpVersion.V2TLS,
+        max_clients=MAX_CONCURRENT_FETCHES,
+    )
+
+
+class FetchSessionManager:
+    """Lazy curl-cffi session shared by page fetches and closed with the application."""
+
+    def __init__(
+        self, *, session_factory: Callable[[], AsyncSession] = create_fetch_session
+    ) -> None:
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closing: set[asyncio.Task[None]] = set()
+
+    def get(self) -> AsyncSession:
+        # curl-cffi sessions are bound to the loop they first ran on, so a new loop
+        # (scripts, tests) gets its own session instead of reusing a stale one.
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._loop is not loop:
+            stale = self._session
+            self._session = self._session_factory()
+            self._loop = loop
+            if stale is not None:
+                # Release the replaced session's curl handles instead of leaking them
+                task = loop.create_task(self._close_stale(stale))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+        return self._session
+
+    @staticmethod
+    async def _close_stale(session: AsyncSession) -> None:
+        try:
+            await session.close()
+        except Exception as error:
+            logger.warning("Failed to close stale fetch session (%s)", type(error).__name__)
+
+    async def close(self) -> None:
+        session = self._session
+        self._session = None
+        self._loop = None
+        loop = asyncio.get_running_loop()
+        pending = [task for task in self._closing if task.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending)
+        if session is not None:
+            await session.close()
+
+
+fetch_session_manager = FetchSessionManager()
+
+
+async def fetch_http_once(
+    session: AsyncSession,
+    url: str,
+    proxy: str | None = None,
+    max_bytes: int = MAX_RESPONSE_BYTES,
+) -> str:
+    # Take the host slot first so requests queued behind a busy host do not hold global slots
+    async with host_fetch_slot(url), _fetch_slots.get():
+        return await _fetch_http_once(session, url, proxy, max_bytes)
+
+
+async def _fetch_http_once(
+    session: AsyncSession,
+    url: str,
+    proxy: str | None,
+    max_bytes: int,
+) -> str:
     op = "web.link_extraction.proxy_fetch" if proxy else "web.link_extraction.direct_fetch"
     safe_url = sanitize_url(url)
     with sentry_sdk.start_span(op=op, description="Fetch URL with curl-cffi") as span:
         span.set_data("url", safe_url)
         span.set_data("proxy_enabled", proxy is not None)
         try:
-            response = await session.get(
-                url,
-                impersonate="chrome120",  # type: ignore
-                proxy=proxy,
-                timeout=20,
-                allow_redirects=True,
-            )
+            response = await session.get(url, proxy=proxy, stream=True, discard_cookies=True)
         except (Timeout, ConnectionError, ProxyError) as error:
             span.set_status("internal_error")
             logger.warning(
@@ -278,11 +455,27 @@ async def fetch_http_once(session: AsyncSession, url: str, proxy: str | None = N
             status_code = int(response.status_code)
             response_url = getattr(response, "url", None) or url
             response_headers = getattr(response, "headers", None)
-            body = str(response.text)
+            if status_code < 400 and not is_textual_content_type(response_headers):
+                span.set_status("internal_error")
+                logger.warning("Unsupported content type for %s", safe_url)
+                raise FetchAttemptError(FetchDecision.STOP, "unsupported content type")
+            body = await _read_capped_body(response, max_bytes)
+        except FetchAttemptError:
+            raise
+        except (Timeout, ConnectionError, ProxyError) as error:
+            span.set_status("internal_error")
+            logger.warning(
+                "Transient HTTP body read failure for %s (%s)",
+                safe_url,
+                type(error).__name__,
+            )
+            raise FetchAttemptError(FetchDecision.RETRY, "transient network failure") from error
         except Exception as error:
             span.set_status("internal_error")
             logger.warning("Invalid HTTP response for %s (%s)", safe_url, type(error).__name__)
             raise FetchAttemptError(FetchDecision.STOP, "invalid HTTP response") from error
+        finally:
+            await _close_stream(response)
         if status_code >= 400:
             decision = classify_status(status_code, response_headers, body)
             _log_response_failure(
@@ -0,0 +1,84 @@
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from database.redis.redis_ops import RedisManager
+
+MEMORY_CACHE_MAX_ENTRIES = 128
+MEMORY_CACHE_TTL_SECONDS = 10 * 60
+
+
+class PageExtractionCache:
+    """
+    Two-tier cache of extracted pages: a small in-process LRU in front of Redis.
+
+    Both tiers are inactive until the application starts the cache with its Redis manager.
+    Extractions are deep-copied in and out of memory so callers never share the nested
+    ``navigation_links`` with later hits.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = MEMORY_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = MEMORY_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._redis_manager: RedisManager | None = None
+        self._memory: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def start(self, redis_manager: RedisManager) -> None:
+        self._redis_manager = redis_manager
+
+    def close(self) -> None:
+        self._redis_manager = None
+        self._memory.clear()
+
+    @staticmethod
+    def _url_hash(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _remember(self, url_hash: str, extraction: dict[str, Any]) -> None:
+        self._memory[url_hash] = (self._clock() + self._ttl_seconds, extraction)
+        self._memory.move_to_end(url_hash)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    async def get(self, url: str) -> dict[str, Any] | None:
+        if self._redis_manager is None:
+            return None
+
+        url_hash = self._url_hash(url)
+        entry = self._memory.get(url_hash)
+        if entry is not None:
+            expires_at, extraction = entry
+            if expires_at > self._clock():
+                self._memory.move_to_end(url_hash)
+                return copy.deepcopy(extraction)
+            del self._memory[url_hash]
+
+        cached = await self._redis_manager.get_page_extraction(url_hash)
+        if (
+            not isinstance(cached, dict)
+            or not isinstance(cached.get("markdown_content"), str)
+            or not isinstance(cached.get("navigation_links"), list)
+        ):
+            return None
+        self._remember(url_hash, copy.deepcopy(cached))
+        return cached
+
+    async def set(self, url: str, extraction: dict[str, Any]) -> None:
+        if self._redis_manager is None or not extraction.get("markdown_content"):
+            return
+
+        url_hash = self._url_hash(url)
+        self._remember(url_hash, copy.deepcopy(extraction))
+        await self._redis_manager.set_page_extraction(url_hash, extraction)
+
+
+page_extraction_cache = PageExtractionCache()
@@ -14,7 +14,7 @@ REDDIT_STRUCTURED_SUFFIXES = (".json", ".rss")
 
 def _prepare_reddit_html_for_markdown(html_content: str) -> str:
     """Preserve rendered user text while narrowing old Reddit HTML to its main content."""
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = BeautifulSoup(html_content, "lxml")
     reddit_main = soup.select_one('div.content[role="main"]')
     root = reddit_main or soup.body or soup
 
@@ -132,6 +132,7 @@ def _content_to_markdown(content: str) -> str:
         convert_images=False,
         strip=["a", "img"],
         autolinks=False,
+        bs4_options="lxml",
     )
     return str(markdown).strip()
 
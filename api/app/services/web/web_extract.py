@@ -2,19 +2,28 @@ import asyncio
 import json
 import logging
 import tempfile
+from dataclasses import dataclass
 from functools import partial
-from typing import TypedDict
-from urllib.parse import urljoin, urlparse
+from typing import TypedDict, cast
+from urllib.parse import urljoin, urlparse, urlsplit
 
 from arxiv2text import arxiv_to_md
-from bs4 import BeautifulSoup
-from curl_cffi.requests import AsyncSession
 from markdownify import markdownify as md
+from selectolax.lexbor import LexborHTMLParser
 from services.proxies import proxy_manager
 from services.web.browser_fetch import browser_fetch_manager
 from services.web.fetch_errors import LinkExtractionError, LinkExtractionFailureReason
-from services.web.http_fetch import FetchAttemptError, FetchDecision, fetch_http_once, sanitize_url
+from services.web.html_conversion import html_conversion_pool
+from services.web.http_fetch import (
+    FetchAttemptError,
+    FetchDecision,
+    fetch_http_once,
+    fetch_session_manager,
+    sanitize_url,
+)
+from services.web.page_cache import page_extraction_cache
 from services.web.reddit import (
+    REDDIT_HOSTS,
     _ensure_url_scheme,
     _is_reddit_json_url,
     _is_reddit_rss_url,
@@ -27,10 +36,41 @@ from services.web.reddit import (
     _prepare_reddit_html_for_markdown,
 )
 
+try:
+    import htmd
+
+    HTMD_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised when the Rust converter is missing
+    htmd = None  # type: ignore[assignment]
+    HTMD_AVAILABLE = False
+
 logger = logging.getLogger("uvicorn.error")
 
 MIN_MARKDOWN_LENGTH = 500
 MAX_NAVIGATION_LINKS = 50
+NOISY_TAGS = frozenset(
+    {"script", "style", "nav", "header", "footer", "aside", "form", "iframe", "noscript"}
+)
+NOISY_TAGS_SELECTOR = ", ".join(sorted(NOISY_TAGS))
+KEEP_EMPTY_TAGS = frozenset({"img", "hr"})
+ARXIV_HOSTS = frozenset({"arxiv.org", "www.arxiv.org", "export.arxiv.org"})
+SPECULATIVE_PROXY_HOSTS = frozenset({"twitter.com", "x.com"})
+
+
+def _build_htmd_options():
+    if not HTMD_AVAILABLE:
+        return None
+    options = htmd.Options()
+    options.heading_style = htmd.HeadingStyle.ATX
+    options.bullet_list_marker = htmd.BulletListMarker.ASTERISK
+    options.ul_bullet_spacing = 1
+    options.ol_number_spacing = 1
+    options.skip_tags = ["img"]
+    options.drop_image_only_links = True
+    return options
+
+
+HTMD_OPTIONS = _build_htmd_options()
 
 
 class NavigationLink(TypedDict):
@@ -43,65 +83,61 @@ class PageExtractionResult(TypedDict):
     navigation_links: list[NavigationLink]
 
 
+_AttemptOutcome = tuple[PageExtractionResult | None, FetchDecision, FetchAttemptError | None]
+
+
 def clean_html(html_content: str) -> str:
     """
     Cleans HTML by extracting the main content and removing clutter.
 
+    Parsing and pruning run in lexbor (via selectolax) rather than a pure-Python tree.
+
     Args:
         html_content: Raw HTML string.
 
     Returns:
         A string of the cleaned HTML content.
     """
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = LexborHTMLParser(html_content)
 
     # 1. First, try to find the main content block. This is the most reliable method.
-    main_content = soup.find("main")
-    if not main_content:
-        main_content = soup.find("article")
-    if not main_content:
+    main_content = tree.css_first("main")
+    if main_content is None:
+        main_content = tree.css_first("article")
+    if main_content is None:
         # As a last resort, use the whole body.
-        main_content = soup.body
-        if not main_content:
+        main_content = tree.body
+        if main_content is None:
             return ""
 
-    # 2. Remove all non-semantic or noisy tags
-    tags_to_remove = [
-        "script",
-        "style",
-        "nav",
-        "header",
-        "footer",
-        "aside",
-        "form",
-        "iframe",
-        "noscript",
-    ]
-    for tag in main_content.find_all(tags_to_remove):
-        tag.decompose()
-
-    # 3. Remove comments
-    for comment in main_content.find_all(
-        string=lambda text: isinstance(text, str) and text.find("<!--") != -1
-    ):
-        comment.extract()
-
-    # Remove empty tags that might be left after cleaning
-    for tag in main_content.find_all():
-        if (
-            not tag.get_text(strip=True)
-            and not tag.find_all(recursive=False)
-            and tag.name not in ["img", "hr"]
+    # 2. Remove all non-semantic or noisy tags with a single selector query. Matches are in
+    # document order, so nested matches are removed before the tag that contains them.
+    for node in reversed(main_content.css(NOISY_TAGS_SELECTOR)):
+        node.decompose()
+
+    # 3. Remove comments and empty tags in one bottom-up walk. Visiting nodes in reverse
+    # document order checks children before their parent, so a parent emptied by the
+    # removal of its children is removed in the same pass.
+    for node in reversed(list(main_content.traverse(include_text=True))[1:]):
+        if node.is_comment_node:
+            node.decompose()
+        elif (
+            node.is_element_node
+            and node.tag not in KEEP_EMPTY_TAGS
+            and not any(child.is_element_node for child in node.iter())
+            and not node.text(strip=True)
         ):
-            tag.decompose()
+            node.decompose()
 
-    return str(main_content)
+    return main_content.html or ""
 
 
 def convert_to_markdown(html_snippet: str, base_url: str) -> str:
     """
     Converts a clean HTML snippet to AI-ready Markdown.
 
+    Uses the Rust-backed htmd converter when installed, with markdownify as the fallback.
+
     Args:
         html_snippet: The cleaned HTML string.
         base_url: The original URL, used to resolve relative links/images.
@@ -109,6 +145,14 @@ def convert_to_markdown(html_snippet: str, base_url: str) -> str:
     Returns:
         A clean Markdown string.
     """
+    if HTMD_OPTIONS is not None:
+        try:
+            return htmd.convert_html(html_snippet, HTMD_OPTIONS) or ""
+        except Exception as error:
+            logger.warning(
+                "Rust Markdown conversion failed; using markdownify (%s)", type(error).__name__
+            )
+
     markdown_text = md(
         html_snippet,
         heading_style="ATX",  # Use '#' for headings
@@ -117,17 +161,18 @@ def convert_to_markdown(html_snippet: str, base_url: str) -> str:
         strip=["img"],  # Strip images but keep their alt text
         autolinks=False,  # Don't automatically convert URLs to links
         base_url=base_url,  # Helps resolve relative image/link paths
+        bs4_options="lxml",  # libxml2 tree builder instead of html.parser
     )
     return markdown_text or ""
 
 
 def extract_navigation_links(html_content: str, base_url: str) -> list[NavigationLink]:
     """Return qualifying HTTP(S) links found under actual ``nav`` elements."""
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = LexborHTMLParser(html_content)
     links: list[NavigationLink] = []
 
-    for anchor in soup.select("nav a[href]"):
-        href = anchor.get("href")
+    for anchor in tree.css("nav a[href]"):
+        href = anchor.attributes.get("href")
         if not isinstance(href, str):
             continue
         href = href.strip()
@@ -146,7 +191,7 @@ def extract_navigation_links(html_content: str, base_url: str) -> list[Navigatio
 
         links.append(
             {
-                "title": " ".join(anchor.get_text(" ", strip=True).split()),
+                "title": " ".join(anchor.text(separator=" ", strip=True).split()),
                 "url": resolved_url,
             }
         )
@@ -156,18 +201,36 @@ def extract_navigation_links(html_content: str, base_url: str) -> list[Navigatio
     return links
 
 
+def _convert_html_page(content: str, base_url: str) -> PageExtractionResult | None:
+    """
+    Runs the CPU-bound HTML stages for one fetched page.
+
+    Kept at module level so process pool workers can unpickle it by reference.
+    """
+    navigation_links = extract_navigation_links(content, base_url)
+
+    if _is_reddit_url(base_url) and not _is_reddit_structured_url(base_url):
+        content = _prepare_reddit_html_for_markdown(content)
+
+    markdown = convert_to_markdown(clean_html(content), base_url=base_url)
+    if len(markdown) < MIN_MARKDOWN_LENGTH:
+        return None
+    return {"markdown_content": markdown, "navigation_links": navigation_links}
+
+
 async def _preprocess_url(url: str) -> tuple[str, bool]:
     """
     Preprocesses the URL to ensure it is well-formed.
     """
     url = _ensure_url_scheme(url)
+    parsed_url = urlsplit(url)
+    host = parsed_url.netloc.lower()
 
-    if _is_reddit_url(url):
-        url = _normalize_reddit_url_for_fetch(url)
+    if host in REDDIT_HOSTS:
+        return _normalize_reddit_url_for_fetch(url), False
 
-    if "arxiv.org" in url:
-        parts = url.split("/")
-        paper_id = parts[-1] if parts[-1] else parts[-2]
+    if host in ARXIV_HOSTS:
+        paper_id = parsed_url.path.rstrip("/").rsplit("/", 1)[-1]
         pdf_url = f"https://arxiv.org/pdf/{paper_id}"
 
         try:
@@ -182,17 +245,66 @@ async def _preprocess_url(url: str) -> tuple[str, bool]:
     return url, False
 
 
+def _is_speculative_proxy_host(url: str) -> bool:
+    host = (urlsplit(url).hostname or "").lower()
+    return any(host == known or host.endswith(f".{known}") for known in SPECULATIVE_PROXY_HOSTS)
+
+
 async def url_to_markdown(url: str) -> str:
     """Return extracted Markdown or raise a controlled ``LinkExtractionError``."""
     result = await extract_web_page(url)
     return result["markdown_content"]
 
 
+@dataclass
+class _InflightExtraction:
+    task: asyncio.Task[PageExtractionResult]
+    waiters: int = 0
+
+
+_inflight_extractions: dict[str, _InflightExtraction] = {}
+
+
 async def extract_web_page(url: str) -> PageExtractionResult:
-    """Return extracted Markdown and navigation links from the same successful attempt."""
+    """
+    Return extracted Markdown and navigation links from the same successful attempt.
+
+    Concurrent calls for the same URL share one in-flight extraction. The shared work is
+    cancelled only once every caller waiting on it has been cancelled.
+    """
+    inflight = _inflight_extractions.get(url)
+    if inflight is None:
+        inflight = _InflightExtraction(asyncio.create_task(_extract_web_page_guarded(url)))
+        _inflight_extractions[url] = inflight
+        inflight.task.add_done_callback(partial(_forget_inflight_extraction, url, inflight))
+
+    inflight.waiters += 1
+    try:
+        return await asyncio.shield(inflight.task)
+    finally:
+        inflight.waiters -= 1
+        if inflight.waiters == 0 and not inflight.task.done():
+            # Unregister now: winding down the attempts takes a while, and a caller that
+            # arrives meanwhile must start a fresh extraction instead of joining this one.
+            _forget_inflight_extraction(url, inflight, inflight.task)
+            inflight.task.cancel()
+
+
+def _forget_inflight_extraction(
+    url: str, inflight: _InflightExtraction, task: asyncio.Task[PageExtractionResult]
+) -> None:
+    if _inflight_extractions.get(url) is inflight:
+        del _inflight_extractions[url]
+
+
+async def _extract_web_page_guarded(url: str) -> PageExtractionResult:
+    cached = await page_extraction_cache.get(url)
+    if cached is not None:
+        return cast(PageExtractionResult, cached)
+
     safe_url = sanitize_url(url)
     try:
-        return await _extract_web_page(url)
+        extraction = await _extract_web_page(url)
     except LinkExtractionError:
         raise
     except Exception as error:
@@ -203,6 +315,9 @@ async def extract_web_page(url: str) -> PageExtractionResult:
         )
         raise LinkExtractionError(LinkExtractionFailureReason.FETCH_FAILED) from error
 
+    await page_extraction_cache.set(url, dict(extraction))
+    return extraction
+
 
 async def _extract_web_page(url: str) -> PageExtractionResult:
     """
@@ -212,7 +327,6 @@ async def _extract_web_page(url: str) -> PageExtractionResult:
     Only transient direct failures enter the ordinary proxy pool. Provider blocks or
     unusable content go directly to the reusable browser fallback.
     """
-    MAX_DIRECT_ATTEMPTS = 1
     MAX_PROXY_ATTEMPTS = 3
     browser_url = _normalize_reddit_url_for_browser(url)
     fetch_url, is_direct_content = await _preprocess_url(url)
@@ -251,125 +365,146 @@ async def _extract_web_page(url: str) -> PageExtractionResult:
                 return {"markdown_content": content, "navigation_links": []}
             return None
 
-        navigation_links = await asyncio.to_thread(extract_navigation_links, content, base_url)
+        return await html_conversion_pool.run(_convert_html_page, content, base_url)
 
-        if _is_reddit_url(base_url) and not _is_reddit_structured_url(base_url):
-            content = await asyncio.to_thread(_prepare_reddit_html_for_markdown, content)
+    session = fetch_session_manager.get()
+    proxy_urls: list[str | None] = []
+    proxy_attempts: list[asyncio.Task[_AttemptOutcome]] = []
 
-        cleaned_html = await asyncio.to_thread(clean_html, content)
-        markdown = await asyncio.to_thread(convert_to_markdown, cleaned_html, base_url=base_url)
-        if len(markdown) < MIN_MARKDOWN_LENGTH:
-            return None
-        return {"markdown_content": markdown, "navigation_links": navigation_links}
+    async def direct_attempt() -> _AttemptOutcome:
+        try:
+            html = await fetch_http_once(session, fetch_url)
+            extraction = await fetch_and_convert(html, fetch_url)
+            if extraction:
+                return extraction, FetchDecision.STOP, None
+            return None, FetchDecision.BROWSER_FALLBACK, None
+        except FetchAttemptError as error:
+            logger.warning(
+                "Direct fetch attempt failed for %s (%s)",
+                safe_fetch_url,
+                error.decision.value,
+            )
+            return None, error.decision, error
+        except Exception as error:
+            logger.warning(
+                "Direct content processing failed for %s (%s)",
+                safe_fetch_url,
+                type(error).__name__,
+            )
+            return None, FetchDecision.BROWSER_FALLBACK, None
 
-    decision = FetchDecision.STOP
-    attempt_error: FetchAttemptError | None = None
-    async with AsyncSession() as session:
-        for attempt in range(MAX_DIRECT_ATTEMPTS):
-            try:
-                html = await fetch_http_once(session, fetch_url)
-                extraction = await fetch_and_convert(html, fetch_url)
+    async def proxy_attempt(attempt: int, proxy_url: str | None) -> _AttemptOutcome:
+        try:
+            html = await fetch_http_once(session, fetch_url, proxy=proxy_url)
+            extraction = await fetch_and_convert(html, fetch_url)
+            if extraction:
+                return extraction, FetchDecision.STOP, None
+            return None, FetchDecision.BROWSER_FALLBACK, None
+        except FetchAttemptError as error:
+            logger.warning(
+                "Proxy attempt %s/%s failed for %s (%s)",
+                attempt + 1,
+                len(proxy_urls),
+                safe_fetch_url,
+                error.decision.value,
+            )
+            return None, error.decision, error
+        except Exception as error:
+            logger.warning(
+                "Proxy content processing failed for %s (%s)",
+                safe_fetch_url,
+                type(error).__name__,
+            )
+            return None, FetchDecision.BROWSER_FALLBACK, None
+
+    async def start_proxy_attempts(limit: int) -> None:
+        """Start proxy attempts until ``limit`` proxies (or the whole pool) are in use."""
+        for _ in range(len(proxy_urls), min(limit, len(proxy_manager.proxies))):
+            proxy_dict = await proxy_manager.get_proxy()
+            if proxy_dict:
+                proxy_url = proxy_dict.get("https", proxy_dict.get("http"))
+                proxy_attempts.append(
+                    asyncio.create_task(proxy_attempt(len(proxy_urls), proxy_url))
+                )
+                proxy_urls.append(proxy_url)
+
+    def rejection(attempt_error: FetchAttemptError | None) -> LinkExtractionError:
+        if attempt_error is not None and attempt_error.status_code is not None:
+            return LinkExtractionError(
+                LinkExtractionFailureReason.HTTP_REJECTED,
+                attempt_error.status_code,
+            )
+        return LinkExtractionError(LinkExtractionFailureReason.FETCH_FAILED)
+
+    direct = asyncio.create_task(direct_attempt())
+    try:
+        # Hosts whose direct fetches usually stall get their first proxy attempt alongside
+        # the direct one, so a success from either side skips the direct timeout.
+        if _is_speculative_proxy_host(fetch_url):
+            await start_proxy_attempts(1)
+
+        pending: set[asyncio.Task[_AttemptOutcome]] = {direct, *proxy_attempts}
+        while direct in pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                extraction, _, _ = task.result()
                 if extraction:
                     return extraction
-                decision = FetchDecision.BROWSER_FALLBACK
-            except FetchAttemptError as error:
-                attempt_error = error
-                decision = error.decision
-                logger.warning(
-                    "Direct fetch attempt %s/%s failed for %s (%s)",
-                    attempt + 1,
-                    MAX_DIRECT_ATTEMPTS,
-                    safe_fetch_url,
-                    decision.value,
-                )
-            except Exception as error:
-                decision = FetchDecision.BROWSER_FALLBACK
-                logger.warning(
-                    "Direct content processing failed for %s (%s)",
-                    safe_fetch_url,
-                    type(error).__name__,
-                )
 
+        _, decision, attempt_error = direct.result()
         if decision is FetchDecision.STOP:
-            if attempt_error is not None and attempt_error.status_code is not None:
-                raise LinkExtractionError(
-                    LinkExtractionFailureReason.HTTP_REJECTED,
-                    attempt_error.status_code,
-                )
-            raise LinkExtractionError(LinkExtractionFailureReason.FETCH_FAILED)
+            raise rejection(attempt_error)
 
         if decision is FetchDecision.RETRY:
-            proxies_to_try = min(MAX_PROXY_ATTEMPTS, len(proxy_manager.proxies))
+            await start_proxy_attempts(MAX_PROXY_ATTEMPTS)
             logger.info(
-                "Transient direct fetch failure; trying %s proxies for %s",
-                proxies_to_try,
+                "Transient direct fetch failure; trying %s proxies concurrently for %s",
+                len(proxy_urls),
                 safe_fetch_url,
             )
-            for attempt in range(proxies_to_try):
-                proxy_dict = await proxy_manager.get_proxy()
-                if not proxy_dict:
-                    continue
-                proxy_url = proxy_dict.get("https", proxy_dict.get("http"))
-                try:
-                    html = await fetch_http_once(session, fetch_url, proxy=proxy_url)
-                    extraction = await fetch_and_convert(html, fetch_url)
-                    if extraction:
-                        return extraction
-                    decision = FetchDecision.BROWSER_FALLBACK
-                except FetchAttemptError as error:
-                    attempt_error = error
-                    decision = error.decision
-                    logger.warning(
-                        "Proxy attempt %s/%s failed for %s (%s)",
-                        attempt + 1,
-                        proxies_to_try,
-                        safe_fetch_url,
-                        decision.value,
-                    )
-                except Exception as error:
-                    decision = FetchDecision.BROWSER_FALLBACK
-                    logger.warning(
-                        "Proxy content processing failed for %s (%s)",
-                        safe_fetch_url,
-                        type(error).__name__,
-                    )
 
+            # Race the proxies and act on the first decisive outcome: a success returns, a
+            # permanent rejection stops, and a challenge goes to the browser. Transient
+            # failures wait for the remaining attempts.
+            for next_attempt in asyncio.as_completed(proxy_attempts):
+                extraction, decision, error = await next_attempt
+                if error is not None:
+                    attempt_error = error
+                if extraction:
+                    return extraction
                 if decision is FetchDecision.STOP:
-                    if attempt_error is not None and attempt_error.status_code is not None:
-                        raise LinkExtractionError(
-                            LinkExtractionFailureReason.HTTP_REJECTED,
-                            attempt_error.status_code,
-                        )
-                    raise LinkExtractionError(LinkExtractionFailureReason.FETCH_FAILED)
+                    raise rejection(attempt_error)
                 if decision is FetchDecision.BROWSER_FALLBACK:
                     break
+    finally:
+        for task in (direct, *proxy_attempts):
+            task.cancel()
+        await asyncio.gather(direct, *proxy_attempts, return_exceptions=True)
 
-        logger.info("Falling back to headless browser for %s", safe_browser_url)
-        try:
-            html = await browser_fetch_manager.fetch(browser_url)
-        except LinkExtractionError:
-            raise
-        except Exception as error:
-            logger.warning(
-                "Browser fallback failed for %s (%s)",
-                safe_browser_url,
-                type(error).__name__,
-            )
-            raise LinkExtractionError(LinkExtractionFailureReason.BROWSER_FAILED) from error
-
-        try:
-            extraction = await fetch_and_convert(html, browser_url)
-            if extraction:
-                return extraction
-            raise LinkExtractionError(LinkExtractionFailureReason.UNUSABLE_CONTENT)
-        except LinkExtractionError:
-            raise
-        except Exception as error:
-            logger.warning(
-                "Browser content processing failed for %s (%s)",
-                safe_browser_url,
-                type(error).__name__,
-            )
-            raise LinkExtractionError(LinkExtractionFailureReason.FETCH_FAILED) from error
+    logger.info("Falling back to headless browser for %s", safe_browser_url)
+    try:
+        html = await browser_fetch_manager.fetch(browser_url)
+    except LinkExtractionError:
+        raise
+    except Exception as error:
+        logger.warning(
+            "Browser fallback failed for %s (%s)",
+            safe_browser_url,
+            type(error).__name__,
+        )
+        raise LinkExtractionError(LinkExtractionFailureReason.BROWSER_FAILED) from error
 
-    raise LinkExtractionError(LinkExtractionFailureReason.FETCH_FAILED)
+    try:
+        extraction = await fetch_and_convert(html, browser_url)
+        if extraction:
+            return extraction
+        raise LinkExtractionError(LinkExtractionFailureReason.UNUSABLE_CONTENT)
+    except LinkExtractionError:
+        raise
+    except Exception as error:
+        logger.warning(
+            "Browser content processing failed for %s (%s)",
+            safe_browser_url,
+            type(error).__name__,
+        )
+        raise LinkExtractionError(LinkExtractionFailureReason.FETCH_FAILED) from error
@@ -1,10 +1,13 @@
+import asyncio
 import html
 import logging
 import os
-from typing import TYPE_CHECKING, Any, Dict, List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, TypedDict
 from urllib.parse import quote, urlparse
 
 import httpx
+import orjson
 import sentry_sdk
 from database.pg.models import QueryTypeEnum
 from database.pg.user_ops.usage_crud import check_and_increment_query_usage
@@ -25,6 +28,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger("uvicorn.error")
 
 NUM_WEB_RESULTS = 5
+RRF_K = 60
+
+
+class FetchPageResult(TypedDict, total=False):
+    markdown_content: str
+    error: str
 
 
 def _escape_markdown_link_label(value: str) -> str:
@@ -45,6 +54,14 @@ def _format_navigation_links_markdown(links: list[NavigationLink]) -> str:
     return "## Navigation links\n\n" + "\n".join(rendered_links)
 
 
+@lru_cache(maxsize=4096)
+def _get_domain(url: str) -> str:
+    try:
+        return urlparse(url).netloc.replace("www.", "")
+    except (ValueError, AttributeError):
+        return ""
+
+
 def _filter_and_rank_results(
     results: List[Dict[str, Any]], ignored_sites: List[str], preferred_sites: List[str]
 ) -> List[Dict[str, Any]]:
@@ -54,22 +71,17 @@ def _filter_and_rank_results(
     if not ignored_sites and not preferred_sites:
         return results
 
-    def get_domain(url: str) -> str:
-        try:
-            return urlparse(url).netloc.replace("www.", "")
-        except (ValueError, AttributeError):
-            return ""
+    ignored = frozenset(ignored_sites)
+    preferred = frozenset(preferred_sites)
 
-    # Filter out ignored sites
-    filtered_results = [
-        res for res in results if get_domain(res.get("url", "")) not in ignored_sites
-    ]
-
-    # Separate preferred results from the rest
+    # Drop ignored sites and separate preferred results from the rest in a single pass
     preferred_results = []
     other_results = []
-    for res in filtered_results:
-        if get_domain(res.get("url", "")) in preferred_sites:
+    for res in results:
+        domain = _get_domain(res.get("url", ""))
+        if domain in ignored:
+            continue
+        if domain in preferred:
             preferred_results.append(res)
         else:
             other_results.append(res)
@@ -78,6 +90,37 @@ def _filter_and_rank_results(
     return preferred_results + other_results
 
 
+def _canonical_result_key(url: str) -> str:
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return url
+    key = parsed.netloc.lower().removeprefix("www.") + (parsed.path.rstrip("/") or "/")
+    return f"{key}?{parsed.query}" if parsed.query else key
+
+
+def _merge_results_rrf(
+    result_lists: List[List[Dict[str, Any]]], k: int = RRF_K
+) -> List[Dict[str, Any]]:
+    """
+    Merges ranked result lists with reciprocal-rank fusion, deduplicating by canonical URL.
+    """
+    scores: Dict[str, float] = {}
+    merged: Dict[str, Dict[str, Any]] = {}
+    for results in result_lists:
+        for rank, result in enumerate(results, start=1):
+            key = _canonical_result_key(result.get("url", ""))
+            scores[key] = scores.get(key, 0.0) + 1 / (k + rank)
+            merged.setdefault(key, result)
+
+    ordered_keys = sorted(merged, key=lambda key: scores[key], reverse=True)
+    return [merged[key] for key in ordered_keys]
+
+
+def _is_successful_search(results: List[Dict[str, Any]]) -> bool:
+    return len(results) > 0 and "error" not in results[0]
+
+
 async def search_searxng(
     query: str,
     time_range: str,
@@ -117,7 +160,7 @@ async def search_searxng(
                 response = await client.get(searxng_url, params=params, timeout=20.0)
                 response.raise_for_status()
 
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 if data.get("unresponsive_engines", []):
                     logger.warning(f"Unresponsive search engines: {data['unresponsive_engines']}")
@@ -125,15 +168,14 @@ async def search_searxng(
                 results = data.get("results", [])
 
                 # Format results
-                formatted_results = []
-                for result in results:
-                    formatted_results.append(
-                        {
-                            "title": result.get("title", ""),
-                            "url": result.get("url", ""),
-                            "content": result.get("content", ""),
-                        }
-                    )
+                formatted_results = [
+                    {
+                        "title": result.get("title", ""),
+                        "url": result.get("url", ""),
+                        "content": result.get("content", ""),
+                    }
+                    for result in results
+                ]
 
                 # Apply filtering and ranking
                 final_results = _filter_and_rank_results(
@@ -185,18 +227,17 @@ async def search_google_custom(
                     search_url, params={k: str(v) for k, v in params.items()}, timeout=10.0
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 results = data.get("items", [])
-                formatted_results = []
-                for result in results:
-                    formatted_results.append(
-                        {
-                            "title": result.get("title", ""),
-                            "url": result.get("link", ""),
-                            "content": result.get("snippet", ""),
-                        }
-                    )
+                formatted_results = [
+                    {
+                        "title": result.get("title", ""),
+                        "url": result.get("link", ""),
+                        "content": result.get("snippet", ""),
+                    }
+                    for result in results
+                ]
 
                 # Apply filtering and ranking
                 final_results = _filter_and_rank_results(
@@ -240,7 +281,7 @@ async def search_web(
             except HTTPException as e:
                 return [{"error": f"Usage Error: {e.detail}"}]
 
-            search_results = await search_searxng(
+            searxng_search = search_searxng(
                 query=query,
                 time_range=time_range,
                 language=language,
@@ -250,7 +291,37 @@ async def search_web(
                 http_client=http_client,
             )
 
-            if len(search_results) > 0 and "error" not in search_results[0].keys():
+            server_google_api_key = os.getenv("GOOGLE_SEARCH_API_KEY")
+            if server_google_api_key and os.getenv("GOOGLE_CSE_ID"):
+                # Both backends are available: query them together and fuse the rankings
+                searxng_results, google_results = await asyncio.gather(
+                    searxng_search,
+                    search_google_custom(
+                        query=query,
+                        api_key=server_google_api_key,
+                        num_results=config.tools_web_search_num_results,
+                        ignored_sites=config.tools_web_search_ignored_sites,
+                        preferred_sites=config.tools_web_search_preferred_sites,
+                        http_client=http_client,
+                    ),
+                )
+                successful = [
+                    results
+                    for results in (searxng_results, google_results)
+                    if _is_successful_search(results)
+                ]
+                if not successful:
+                    return google_results
+                merged_results = _filter_and_rank_results(
+                    _merge_results_rrf(successful),
+                    config.tools_web_search_ignored_sites,
+                    config.tools_web_search_preferred_sites,
+                )
+                return merged_results[: config.tools_web_search_num_results]
+
+            search_results = await searxng_search
+
+            if _is_successful_search(search_results):
                 return search_results
             logger.warning(
                 "SearxNG search failed or returned no results, falling back to Google Custom Search."  # noqa: E501
@@ -271,7 +342,7 @@ async def search_web(
 
 async def fetch_page(
     url: str, max_length: int, pg_engine: SQLAlchemyAsyncEngine, user_id: str
-) -> Dict[str, Any]:
+) -> FetchPageResult:
     """
     Fetches the content of a URL and returns it as Markdown.
     """
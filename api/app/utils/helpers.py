@@ -1,11 +1,13 @@
 import logging
 import os
+from functools import cache
 
 from dotenv import load_dotenv
 
 logger = logging.getLogger("uvicorn.error")
 
 
+@cache
 def load_environment_variables():
     if os.getenv("ENV", "dev") == "dev":
         logger.info("Loading environment variables from @/docker/.env.local")
@@ -1,6 +1,12 @@
+import logging
+
 from models.message import MessageContentTypeEnum
 from rich import print as rprint
 
+logger = logging.getLogger("uvicorn.error")
+
+_CONTENT_ATTRS = ("fileId", "file_id", "name", "url", "id", "text", "content")
+
 
 def _trunc(s: str | None, n: int = 100) -> str | None:
     if s is None:
@@ -10,6 +16,10 @@ def _trunc(s: str | None, n: int = 100) -> str | None:
 
 
 def pydantic_print(model):
+    # Building and rich-formatting the summary is costly; skip it unless debugging
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     printable = []
     for m in model:
         msg_repr = {
@@ -21,27 +31,17 @@ def pydantic_print(model):
 
         for c in getattr(m, "content", []) or []:
             c_type = getattr(c, "type", None)
-            if c_type == MessageContentTypeEnum.text or str(c_type) == str(
-                MessageContentTypeEnum.text
-            ):
+            if c_type == MessageContentTypeEnum.text:
                 msg_repr["content"].append(
                     {"type": c_type, "text": _trunc(getattr(c, "text", None), 100)}
                 )
             else:
                 # Collect string-like attributes and truncate them
-                attrs = {}
-                for attr in (
-                    "fileId",
-                    "file_id",
-                    "name",
-                    "url",
-                    "id",
-                    "text",
-                    "content",
-                ):
-                    val = getattr(c, attr, None)
-                    if val is not None:
-                        attrs[attr] = _trunc(val, 100)
+                attrs = {
+                    attr: _trunc(val, 100)
+                    for attr in _CONTENT_ATTRS
+                    if (val := getattr(c, attr, None)) is not None
+                }
                 # Fallback: if no known attrs found, include repr truncated
                 if not attrs:
                     attrs["repr"] = _trunc(repr(c), 100)
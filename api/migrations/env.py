@@ -50,6 +50,16 @@ def get_url():
     return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db}"
 
 
+def get_session_settings() -> dict[str, str]:
+    # Fail fast when a lock is held elsewhere instead of queueing every other query
+    # behind a blocked ALTER TABLE; the migration can simply be retried.
+    return {
+        "lock_timeout": os.getenv("MIGRATION_LOCK_TIMEOUT", "3s"),
+        "statement_timeout": os.getenv("MIGRATION_STATEMENT_TIMEOUT", "30min"),
+        "idle_in_transaction_session_timeout": "5min",
+    }
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -96,6 +106,7 @@ async def run_migrations_online() -> None:
         configuration,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args={"server_settings": get_session_settings()},
     )
 
     async with connectable.connect() as connection:
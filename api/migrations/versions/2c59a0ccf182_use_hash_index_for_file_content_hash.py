@@ -0,0 +1,34 @@
+"""use hash index for file content_hash
+
+Revision ID: 2c59a0ccf182
+Revises: af70eece20fc
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2c59a0ccf182"
+down_revision = "af70eece20fc"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases migrated before 4075d92afec6 built the partial hash index still carry the
+    # full btree one; swap it. Both statements are no-ops on fresh installs.
+    with op.get_context().autocommit_block():
+        # Concurrent builds wait out older transactions; exempt them from lock_timeout
+        op.execute("SET lock_timeout = 0")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_files_content_hash "
+            "ON files USING hash (content_hash) WHERE content_hash IS NOT NULL"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_files_content_hash")
+        op.execute("RESET lock_timeout")
+
+
+def downgrade() -> None:
+    # 4075d92afec6 now defines the hash index itself, so there is no btree to restore
+    pass
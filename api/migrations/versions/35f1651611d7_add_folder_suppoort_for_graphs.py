@@ -50,9 +50,6 @@ def upgrade() -> None:
     # Add the 'folder_id' column to the 'graphs' table
     op.add_column("graphs", sa.Column("folder_id", sa.UUID(as_uuid=True), nullable=True))
 
-    # Create an index on the new column
-    op.create_index(op.f("ix_graphs_folder_id"), "graphs", ["folder_id"], unique=False)
-
     # Create the foreign key constraint with ON DELETE SET NULL
     op.create_foreign_key(
         "fk_graphs_folder_id",  # Constraint name
@@ -63,13 +60,25 @@ def upgrade() -> None:
         ondelete="SET NULL",
     )
 
+    # Index the existing 'graphs' table without blocking writes during the build
+    with op.get_context().autocommit_block():
+        # Concurrent builds wait out older transactions; exempt them from lock_timeout
+        op.execute("SET lock_timeout = 0")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_graphs_folder_id ON graphs (folder_id)"
+        )
+        op.execute("RESET lock_timeout")
+
 
 def downgrade() -> None:
     # Drop the foreign key constraint from 'graphs'
     op.drop_constraint("fk_graphs_folder_id", "graphs", type_="foreignkey")
 
     # Drop the index and column from 'graphs'
-    op.drop_index(op.f("ix_graphs_folder_id"), table_name="graphs")
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = 0")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_graphs_folder_id")
+        op.execute("RESET lock_timeout")
     op.drop_column("graphs", "folder_id")
 
     # Drop the 'folders' table
@@ -7,8 +7,6 @@ Create Date: 2025-09-22 11:57:58.335809
 
 """
 
-import sqlalchemy as sa
-import sqlmodel
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -19,40 +17,9 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add column plan_type to table users
-    # plan_type: str = Field(
-    #     default="free", sa_column=Column(TEXT, nullable=False)
-    # )  # Options: "admin", "premium", "free"
-    with op.batch_alter_table("users", schema=None) as batch_op:
-        batch_op.add_column(
-            sa.Column(
-                "plan_type",
-                sqlmodel.sql.sqltypes.AutoString(),
-                nullable=False,
-                server_default="free",
-            )
-        )
-
-    # Add column is_admin to table users
-    with op.batch_alter_table("users", schema=None) as batch_op:
-        batch_op.add_column(
-            sa.Column(
-                "is_admin",
-                sa.Boolean(),
-                nullable=False,
-                server_default=sa.sql.expression.false(),
-            )
-        )
-
+    # users.plan_type and users.is_admin now come from 8969e73ef9b7 (one ALTER TABLE per table)
     pass
 
 
 def downgrade() -> None:
-    # Remove column plan_type from table users
-    with op.batch_alter_table("users", schema=None) as batch_op:
-        batch_op.drop_column("plan_type")
-
-    with op.batch_alter_table("users", schema=None) as batch_op:
-        batch_op.drop_column("is_admin")
-
     pass
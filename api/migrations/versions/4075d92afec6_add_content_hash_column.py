@@ -8,7 +8,6 @@ Create Date: 2025-10-03 15:16:41.319024
 """
 
 import sqlalchemy as sa
-import sqlmodel
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -19,13 +18,27 @@ depends_on = None
 
 
 def upgrade() -> None:
-    with op.batch_alter_table("files", schema=None) as batch_op:
-        batch_op.add_column(sa.Column("content_hash", sa.TEXT(), nullable=True, index=True))
+    op.add_column("files", sa.Column("content_hash", sa.TEXT(), nullable=True))
+
+    # Only equality lookups hit content_hash, so a hash index on the non-null rows suffices.
+    # Build it without blocking uploads on an already populated table
+    with op.get_context().autocommit_block():
+        # Concurrent builds wait out older transactions; exempt them from lock_timeout
+        op.execute("SET lock_timeout = 0")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_files_content_hash "
+            "ON files USING hash (content_hash) WHERE content_hash IS NOT NULL"
+        )
+        op.execute("RESET lock_timeout")
     pass
 
 
 def downgrade() -> None:
-    with op.batch_alter_table("files", schema=None) as batch_op:
-        batch_op.drop_column("content_hash")
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = 0")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_files_content_hash")
+        op.execute("RESET lock_timeout")
+
+    op.drop_column("files", "content_hash")
 
     pass
@@ -0,0 +1,37 @@
+"""index graph history page
+
+Revision ID: 523b73e76fb5
+Revises: 2c59a0ccf182
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "523b73e76fb5"
+down_revision = "2c59a0ccf182"
+branch_labels = None
+depends_on = None
+
+# Matches the history page query (user_id = ? AND NOT temporary ORDER BY updated_at DESC,
+# id DESC), so each page is read straight off the index without filtering or sorting.
+HISTORY_INDEX = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_graphs_user_history "
+    "ON graphs (user_id, updated_at DESC, id DESC) WHERE temporary IS FALSE"
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Concurrent builds wait out older transactions; exempt them from lock_timeout
+        op.execute("SET lock_timeout = 0")
+        op.execute(HISTORY_INDEX)
+        op.execute("RESET lock_timeout")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = 0")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_graphs_user_history")
+        op.execute("RESET lock_timeout")
@@ -7,7 +7,6 @@ Create Date: 2025-09-21 09:40:23.998822
 
 """
 
-import sqlalchemy as sa
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -18,17 +17,9 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add pinned column to graphs table
-    # pinned: bool = Field(default=False, nullable=False)
-    op.add_column(
-        "graphs",
-        sa.Column("pinned", sa.Boolean(), nullable=False, server_default=sa.sql.expression.false()),
-    )
-
+    # graphs.pinned now comes from 8969e73ef9b7 (one ALTER TABLE per table)
     pass
 
 
 def downgrade() -> None:
-    op.drop_column("graphs", "pinned")
-
     pass
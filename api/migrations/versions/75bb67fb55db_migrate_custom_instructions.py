@@ -18,6 +18,8 @@ down_revision = "794c66868cfa"
 branch_labels = None
 depends_on = None
 
+UPDATE_BATCH_SIZE = 1000
+
 default_systemPrompt = [
     {
         "id": "f342a558-5826-45cf-9b08-5f130414a4ab",
@@ -31,33 +33,83 @@ default_systemPrompt = [
 
 default_custom_instructions = ["f342a558-5826-45cf-9b08-5f130414a4ab"]
 
+# Serialized once; DML binds them as parameters, DDL (which cannot) inlines the constant
+default_systemPrompt_json = json.dumps(default_systemPrompt)
+default_custom_instructions_json = json.dumps(default_custom_instructions)
 
-def upgrade() -> None:
-    # Remove models.globalSystemPrompt key from settings_data json column of table settings
-    op.execute(
-        "UPDATE settings SET settings_data = settings_data - 'globalSystemPrompt' "
-        "WHERE jsonb_typeof(settings_data) = 'object'"
-    )
 
-    # Set models.systemPrompt to default_systemPrompt for all users in settings_data json column of table settings
-    op.execute(
-        f"UPDATE settings SET settings_data = jsonb_set(settings_data, '{{models,systemPrompt}}', '{json.dumps(default_systemPrompt)}')"
-    )
-
-    # Clear custom_instructions column and change its type to JSONB array and set it to default_custom_instructions for all rows
-    op.execute(
-        f"UPDATE graphs SET custom_instructions = '{json.dumps(default_custom_instructions)}'::jsonb"
-    )
+def upgrade() -> None:
+    # Rewrite settings in committed batches so row locks and WAL stay bounded
+    with op.get_context().autocommit_block():
+        # Remove models.globalSystemPrompt key from settings_data json column of table settings
+        _update_in_batches(
+            "settings",
+            "settings_data = settings_data - 'globalSystemPrompt'",
+            "jsonb_typeof(settings_data) = 'object' AND settings_data ? 'globalSystemPrompt'",
+        )
+
+        # Set models.systemPrompt to default_systemPrompt wherever it is not already a list;
+        # missing, null or otherwise malformed values are all replaced
+        _update_in_batches(
+            "settings",
+            "settings_data = jsonb_set("
+            "settings_data, '{models,systemPrompt}', CAST(:system_prompt AS jsonb))",
+            "jsonb_typeof(settings_data) = 'object' "
+            "AND jsonb_typeof(settings_data -> 'models' -> 'systemPrompt') "
+            "IS DISTINCT FROM 'array'",
+            {"system_prompt": default_systemPrompt_json},
+        )
+
+    # Reset custom_instructions to default_custom_instructions while changing its type:
+    # a constant USING expression rewrites the table once, with no UPDATE pass beforehand
     op.alter_column(
         "graphs",
         "custom_instructions",
         type_=sa.JSON,
-        postgresql_using="custom_instructions::jsonb",
+        postgresql_using=f"'{default_custom_instructions_json}'::json",
     )
 
     pass
 
 
+def _update_in_batches(
+    table: str,
+    assignment: str,
+    condition: str = "TRUE",
+    params: dict[str, str] | None = None,
+) -> None:
+    """Apply ``assignment`` to every matching row, one keyset batch of ids per commit."""
+    params = params or {}
+    update_sql = f"UPDATE {table} SET {assignment} WHERE ({condition})"
+    if op.get_context().as_sql:
+        op.execute(sa.text(update_sql).bindparams(**params))
+        return
+
+    bind = op.get_bind()
+    batch_update = sa.text(f"{update_sql} AND id BETWEEN :first AND :last")
+    last_id = None
+    while True:
+        if last_id is None:
+            batch = bind.execute(
+                sa.text(f"SELECT id FROM {table} ORDER BY id LIMIT :limit"),
+                {"limit": UPDATE_BATCH_SIZE},
+            )
+        else:
+            batch = bind.execute(
+                sa.text(f"SELECT id FROM {table} WHERE id > :last ORDER BY id LIMIT :limit"),
+                {"last": last_id, "limit": UPDATE_BATCH_SIZE},
+            )
+        ids = batch.scalars().all()
+        if not ids:
+            return
+
+        bind.execute(
+            batch_update,
+            {**params, "first": ids[0], "last": ids[-1]},
+        )
+        last_id = ids[-1]
+
+
 def downgrade() -> None:
     # Add models.globalSystemPrompt key with empty array value to settings_data json column of table settings
     op.execute(
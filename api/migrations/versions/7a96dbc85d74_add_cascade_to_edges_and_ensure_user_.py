@@ -7,8 +7,6 @@ Create Date: 2025-12-30 15:55:39.280288
 
 """
 
-import sqlalchemy as sa
-import sqlmodel
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -17,53 +15,30 @@ down_revision = "033d7a6291b3"
 branch_labels = None
 depends_on = None
 
+# (constraint, table, column, referenced table) for each foreign key that gains ON DELETE CASCADE
+CASCADE_FOREIGN_KEYS = (
+    ("edges_graph_id_fkey", "edges", "graph_id", "graphs"),
+    ("graphs_user_id_fkey", "graphs", "user_id", "users"),
+    ("folders_user_id_fkey", "folders", "user_id", "users"),
+    ("files_user_id_fkey", "files", "user_id", "users"),
+)
 
-def upgrade() -> None:
-    # 1. Edges: graph_id -> graphs.id
-    # Drop existing constraint (assuming default naming convention)
-    op.drop_constraint("edges_graph_id_fkey", "edges", type_="foreignkey")
-    # Recreate with CASCADE
-    op.create_foreign_key(
-        "edges_graph_id_fkey",
-        "edges",
-        "graphs",
-        ["graph_id"],
-        ["id"],
-        ondelete="CASCADE",
-    )
-
-    # 2. Graphs: user_id -> users.id
-    op.drop_constraint("graphs_user_id_fkey", "graphs", type_="foreignkey")
-    op.create_foreign_key(
-        "graphs_user_id_fkey",
-        "graphs",
-        "users",
-        ["user_id"],
-        ["id"],
-        ondelete="CASCADE",
-    )
 
-    # 3. Folders: user_id -> users.id
-    op.drop_constraint("folders_user_id_fkey", "folders", type_="foreignkey")
-    op.create_foreign_key(
-        "folders_user_id_fkey",
-        "folders",
-        "users",
-        ["user_id"],
-        ["id"],
-        ondelete="CASCADE",
-    )
-
-    # 4. Files: user_id -> users.id
-    op.drop_constraint("files_user_id_fkey", "files", type_="foreignkey")
-    op.create_foreign_key(
-        "files_user_id_fkey",
-        "files",
-        "users",
-        ["user_id"],
-        ["id"],
-        ondelete="CASCADE",
-    )
+def upgrade() -> None:
+    # Swap each constraint in a single ALTER TABLE so the column is never left unconstrained.
+    # NOT VALID skips the scan of existing rows, which already satisfy the old constraint.
+    for constraint, table, column, referenced in CASCADE_FOREIGN_KEYS:
+        op.execute(f"""
+            ALTER TABLE {table}
+            DROP CONSTRAINT {constraint},
+            ADD CONSTRAINT {constraint} FOREIGN KEY ({column})
+                REFERENCES {referenced} (id) ON DELETE CASCADE NOT VALID
+        """)
+
+    # Validation only takes SHARE UPDATE EXCLUSIVE, so it runs in its own transaction
+    with op.get_context().autocommit_block():
+        for constraint, table, _, _ in CASCADE_FOREIGN_KEYS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}")
 
 
 def downgrade() -> None:
@@ -7,8 +7,6 @@ Create Date: 2025-09-16 15:46:24.961746
 
 """
 
-import sqlalchemy as sa
-import sqlmodel
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -17,20 +15,30 @@ down_revision = "75bb67fb55db"
 branch_labels = None
 depends_on = None
 
+# Columns of the 8969e73ef9b7..3819a2743c6d chain, added here in one statement per table so
+# downgrading through the stubs that used to own them stays coherent. IF NOT EXISTS keeps
+# a rerun after a partial upgrade harmless.
+SQUASHED_COLUMNS = {
+    "graphs": (
+        "temporary BOOLEAN NOT NULL DEFAULT false",
+        "pinned BOOLEAN NOT NULL DEFAULT false",
+    ),
+    "users": (
+        "plan_type VARCHAR NOT NULL DEFAULT 'free'",
+        "is_admin BOOLEAN NOT NULL DEFAULT false",
+    ),
+}
 
-def upgrade() -> None:
-    # Add the 'temporary' column to the 'graph' table with a default value of False
-    # temporary: bool = Field(default=False, nullable=False)
-    op.add_column(
-        "graphs",
-        sa.Column("temporary", sa.Boolean(), nullable=False, server_default=sa.text("false")),
-    )
 
-    pass
+def upgrade() -> None:
+    for table, columns in SQUASHED_COLUMNS.items():
+        clauses = ", ".join(f"ADD COLUMN IF NOT EXISTS {column}" for column in columns)
+        op.execute(f"ALTER TABLE {table} {clauses}")
 
 
 def downgrade() -> None:
-    # Remove the 'temporary' column from the 'graph' table
-    op.drop_column("graphs", "temporary")
-
-    pass
+    for table, columns in reversed(SQUASHED_COLUMNS.items()):
+        clauses = ", ".join(
+            f"DROP COLUMN IF EXISTS {column.split(maxsplit=1)[0]}" for column in columns
+        )
+        op.execute(f"ALTER TABLE {table} {clauses}")
@@ -18,10 +18,8 @@ depends_on = None
 
 
 def upgrade() -> None:
-    with op.batch_alter_table("tool_calls", schema=None) as batch_op:
-        batch_op.add_column(sa.Column("duration_ms", sa.Integer(), nullable=True))
+    op.add_column("tool_calls", sa.Column("duration_ms", sa.Integer(), nullable=True))
 
 
 def downgrade() -> None:
-    with op.batch_alter_table("tool_calls", schema=None) as batch_op:
-        batch_op.drop_column("duration_ms")
+    op.drop_column("tool_calls", "duration_ms")
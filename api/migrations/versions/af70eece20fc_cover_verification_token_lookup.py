@@ -0,0 +1,43 @@
+"""cover verification token lookup
+
+Revision ID: af70eece20fc
+Revises: b8314dce3fbf
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "af70eece20fc"
+down_revision = "b8314dce3fbf"
+branch_labels = None
+depends_on = None
+
+# Verification looks tokens up by (email, code) and then checks expires_at and user_id,
+# so a composite covering index answers it with an index-only scan and supersedes the
+# single-column email index. The user_id index stays for the per-user token cleanup.
+EMAIL_CODE_INDEX = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_verification_tokens_email_code "
+    "ON verification_tokens (email, code) INCLUDE (user_id, expires_at)"
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Concurrent builds wait out older transactions; exempt them from lock_timeout
+        op.execute("SET lock_timeout = 0")
+        op.execute(EMAIL_CODE_INDEX)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_verification_tokens_email")
+        op.execute("RESET lock_timeout")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = 0")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_verification_tokens_email "
+            "ON verification_tokens (email)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_verification_tokens_email_code")
+        op.execute("RESET lock_timeout")
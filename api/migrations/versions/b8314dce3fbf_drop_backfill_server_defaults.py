@@ -0,0 +1,38 @@
+"""drop backfill server defaults
+
+Revision ID: b8314dce3fbf
+Revises: ed27c2bb90a4
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b8314dce3fbf"
+down_revision = "ed27c2bb90a4"
+branch_labels = None
+depends_on = None
+
+# Server defaults that only existed to back-fill rows when these NOT NULL columns were
+# added. The models set the values in Python, matching the newer migrations that drop
+# the default right after the column is added.
+BACKFILL_SERVER_DEFAULTS = (
+    ("users", "plan_type", sa.text("'free'")),
+    ("users", "is_admin", sa.false()),
+    ("users", "is_verified", sa.false()),
+    ("users", "has_seen_welcome", sa.false()),
+    ("graphs", "pinned", sa.false()),
+    ("graphs", "temporary", sa.false()),
+)
+
+
+def upgrade() -> None:
+    for table, column, _ in BACKFILL_SERVER_DEFAULTS:
+        op.alter_column(table, column, server_default=None)
+
+
+def downgrade() -> None:
+    for table, column, server_default in BACKFILL_SERVER_DEFAULTS:
+        op.alter_column(table, column, server_default=server_default)
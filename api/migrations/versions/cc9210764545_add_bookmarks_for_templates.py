@@ -33,10 +33,12 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(
             ["template_id"],
             ["prompt_templates.id"],
+            ondelete="CASCADE",
         ),
         sa.ForeignKeyConstraint(
             ["user_id"],
             ["users.id"],
+            ondelete="CASCADE",
         ),
         sa.PrimaryKeyConstraint("user_id", "template_id"),
     )
@@ -0,0 +1,49 @@
+"""index foreign key columns
+
+Revision ID: ed27c2bb90a4
+Revises: 4e7a9c2b6d10
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "ed27c2bb90a4"
+down_revision = "4e7a9c2b6d10"
+branch_labels = None
+depends_on = None
+
+# Referencing columns without an index force a sequential scan of the child table
+# whenever a parent row is deleted and the ON DELETE action has to find its children.
+FOREIGN_KEY_INDEXES = (
+    ("idx_template_bookmarks_template_id", "template_bookmarks", "template_id"),
+    ("idx_folders_workspace_id", "folders", "workspace_id"),
+    ("idx_graphs_workspace_id", "graphs", "workspace_id"),
+)
+
+# fd447b227777 owns this index, but databases that ran it before it created the index
+# are missing it; build it here as well and leave it in place on downgrade.
+WORKSPACES_USER_ID_INDEX = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_workspaces_user_id ON workspaces (user_id)"
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Concurrent builds wait out older transactions; exempt them from lock_timeout
+        op.execute("SET lock_timeout = 0")
+        for index_name, table, column in FOREIGN_KEY_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table} ({column})"
+            )
+        op.execute(WORKSPACES_USER_ID_INDEX)
+        op.execute("RESET lock_timeout")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = 0")
+        for index_name, _, _ in reversed(FOREIGN_KEY_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+        op.execute("RESET lock_timeout")
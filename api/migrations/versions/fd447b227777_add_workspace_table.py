@@ -18,10 +18,17 @@ down_revision = "c8c2d84a3b86"
 branch_labels = None
 depends_on = None
 
+WORKSPACE_INSERT_BATCH_SIZE = 5000
+BACKFILL_BATCH_SIZE = 500
+BACKFILL_TABLES = ("folders", "graphs")
+
 
 def upgrade() -> None:
     op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"')
 
+    # The back-fill below commits as it goes, so everything before it is already committed
+    # when it fails. Every statement here is idempotent so a rerun can resume from there.
+
     # 1. Create workspaces table
     op.create_table(
         "workspaces",
@@ -47,58 +54,167 @@ def upgrade() -> None:
         ),
         sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
         sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
     )
-
-    # 2. Add workspace_id to folders
-    op.add_column(
-        "folders", sa.Column("workspace_id", postgresql.UUID(as_uuid=True), nullable=True)
-    )
-    op.create_foreign_key(
-        "fk_folders_workspace_id",
-        "folders",
-        "workspaces",
-        ["workspace_id"],
-        ["id"],
-        ondelete="CASCADE",
-    )
-
-    # 3. Add workspace_id to graphs
-    op.add_column("graphs", sa.Column("workspace_id", postgresql.UUID(as_uuid=True), nullable=True))
-    op.create_foreign_key(
-        "fk_graphs_workspace_id",
-        "graphs",
-        "workspaces",
-        ["workspace_id"],
-        ["id"],
-        ondelete="SET NULL",
+    # Every back-fill batch and the insert trigger look workspaces up by owner
+    op.create_index(
+        "idx_workspaces_user_id", "workspaces", ["user_id"], unique=False, if_not_exists=True
     )
 
-    # 4. Data Migration
-    # Create default workspaces for all existing users
+    # 2. Add workspace_id to folders and graphs, one ALTER TABLE per table. Every row
+    # starts out NULL, so the foreign keys are added NOT VALID and validated after the
+    # back-fill without blocking writes. ADD CONSTRAINT has no IF NOT EXISTS, so a
+    # leftover constraint from an interrupted run is dropped and re-added in place.
     op.execute("""
-        INSERT INTO workspaces (id, user_id, name, created_at, updated_at)
-        SELECT uuid_generate_v4(), id, 'Default', now(), now()
-        FROM users
+        ALTER TABLE folders
+        ADD COLUMN IF NOT EXISTS workspace_id uuid,
+        DROP CONSTRAINT IF EXISTS fk_folders_workspace_id,
+        ADD CONSTRAINT fk_folders_workspace_id FOREIGN KEY (workspace_id)
+            REFERENCES workspaces (id) ON DELETE CASCADE NOT VALID
     """)
-
-    # Link existing folders to the new default workspace of their owner
     op.execute("""
-        UPDATE folders f
-        SET workspace_id = w.id
-        FROM workspaces w
-        WHERE f.user_id = w.user_id
+        ALTER TABLE graphs
+        ADD COLUMN IF NOT EXISTS workspace_id uuid,
+        DROP CONSTRAINT IF EXISTS fk_graphs_workspace_id,
+        ADD CONSTRAINT fk_graphs_workspace_id FOREIGN KEY (workspace_id)
+            REFERENCES workspaces (id) ON DELETE SET NULL NOT VALID
     """)
 
-    # Link existing graphs to the new default workspace of their owner
+    # 4. Data Migration
+    # Rows inserted by live traffic while the back-fill runs get their owner's default
+    # workspace from a temporary trigger, so batches that already passed stay complete.
     op.execute("""
-        UPDATE graphs g
+        CREATE OR REPLACE FUNCTION workspace_backfill_default() RETURNS trigger AS $$
+        BEGIN
+            NEW.workspace_id := (
+                SELECT w.id FROM workspaces w
+                WHERE w.user_id = NEW.user_id
+                ORDER BY w.created_at
+                LIMIT 1
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in BACKFILL_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_workspace_backfill ON {table}")
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_workspace_backfill
+            BEFORE INSERT ON {table}
+            FOR EACH ROW WHEN (NEW.workspace_id IS NULL)
+            EXECUTE FUNCTION workspace_backfill_default()
+        """)
+
+    # Create default workspaces for all existing users, then link existing folders and
+    # graphs to the new default workspace of their owner. Owner ranges are served by
+    # ix_folders_user_id and idx_graphs_user_updated_at.
+    with op.get_context().autocommit_block():
+        _insert_default_workspaces()
+        for table in BACKFILL_TABLES:
+            _backfill_workspace_ids(table)
+
+        # Validation only takes SHARE UPDATE EXCLUSIVE, so it runs in its own transaction
+        op.execute("ALTER TABLE folders VALIDATE CONSTRAINT fk_folders_workspace_id")
+        op.execute("ALTER TABLE graphs VALIDATE CONSTRAINT fk_graphs_workspace_id")
+
+    _drop_backfill_triggers()
+
+
+def _insert_default_workspaces() -> None:
+    """
+    Create one 'Default' workspace per user in committed keyset batches.
+
+    Users that already have a workspace are skipped, so a rerun after a partial insert
+    picks up where it stopped instead of duplicating defaults.
+    """
+    insert_sql = """
+        INSERT INTO workspaces (user_id, name)
+        SELECT id, 'Default' FROM users
+        WHERE NOT EXISTS (SELECT 1 FROM workspaces w WHERE w.user_id = users.id)
+    """
+    if op.get_context().as_sql:
+        op.execute(insert_sql)
+        return
+
+    bind = op.get_bind()
+    last_user_id = None
+    while True:
+        if last_user_id is None:
+            batch = bind.execute(
+                sa.text(f"{insert_sql} ORDER BY id LIMIT :limit RETURNING user_id"),
+                {"limit": WORKSPACE_INSERT_BATCH_SIZE},
+            )
+        else:
+            batch = bind.execute(
+                sa.text(f"{insert_sql} AND id > :last ORDER BY id LIMIT :limit RETURNING user_id"),
+                {"last": last_user_id, "limit": WORKSPACE_INSERT_BATCH_SIZE},
+            )
+        user_ids = batch.scalars().all()
+        if not user_ids:
+            return
+        last_user_id = max(user_ids)
+
+
+def _backfill_workspace_ids(table: str) -> None:
+    """
+    Set workspace_id in keyset batches of owners, committing after each batch.
+
+    Batches skip rows locked by live traffic; a final sweep picks those up once the
+    bulk of the table is done.
+    """
+    update_sql = f"""
+        UPDATE {table} t
         SET workspace_id = w.id
         FROM workspaces w
-        WHERE g.user_id = w.user_id
+        WHERE t.user_id = w.user_id
+          AND t.workspace_id IS NULL
+    """
+    if op.get_context().as_sql:
+        op.execute(update_sql)
+        return
+
+    bind = op.get_bind()
+    batch_sql = sa.text(f"""
+        {update_sql}
+          AND t.id IN (
+              SELECT id FROM {table}
+              WHERE user_id BETWEEN :first AND :last
+                AND workspace_id IS NULL
+              FOR UPDATE SKIP LOCKED
+          )
     """)
+    last_user_id = None
+    while True:
+        if last_user_id is None:
+            batch = bind.execute(
+                sa.text("SELECT id FROM users ORDER BY id LIMIT :limit"),
+                {"limit": BACKFILL_BATCH_SIZE},
+            )
+        else:
+            batch = bind.execute(
+                sa.text("SELECT id FROM users WHERE id > :last ORDER BY id LIMIT :limit"),
+                {"last": last_user_id, "limit": BACKFILL_BATCH_SIZE},
+            )
+        user_ids = batch.scalars().all()
+        if not user_ids:
+            break
+
+        bind.execute(batch_sql, {"first": user_ids[0], "last": user_ids[-1]})
+        last_user_id = user_ids[-1]
+
+    bind.execute(sa.text(update_sql))
+
+
+def _drop_backfill_triggers() -> None:
+    for table in BACKFILL_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_workspace_backfill ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS workspace_backfill_default()")
 
 
 def downgrade() -> None:
+    # 0. Clean up back-fill triggers left behind by an interrupted upgrade
+    _drop_backfill_triggers()
+
     # 1. Drop foreign keys and columns
     op.drop_constraint("fk_graphs_workspace_id", "graphs", type_="foreignkey")
     op.drop_column("graphs", "workspace_id")
@@ -0,0 +1,39 @@
+import importlib
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+sys.path.append(str(APP_DIR))
+
+content_hash_migration = importlib.import_module(
+    "migrations.versions.4075d92afec6_add_content_hash_column"
+)
+
+
+def test_content_hash_index_is_built_concurrently_outside_the_transaction() -> None:
+    events: list[str] = []
+    context = MagicMock()
+    context.autocommit_block.side_effect = lambda: events.append("autocommit") or nullcontext()
+
+    with (
+        patch.object(content_hash_migration.op, "add_column") as add_column,
+        patch.object(content_hash_migration.op, "get_context", return_value=context),
+        patch.object(
+            content_hash_migration.op, "execute", side_effect=lambda sql: events.append(sql)
+        ),
+    ):
+        content_hash_migration.upgrade()
+
+    (table, column), _ = add_column.call_args
+    assert table == "files"
+    assert column.name == "content_hash"
+    assert column.index is None
+    assert events == [
+        "autocommit",
+        "SET lock_timeout = 0",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_files_content_hash "
+        "ON files USING hash (content_hash) WHERE content_hash IS NOT NULL",
+        "RESET lock_timeout",
+    ]
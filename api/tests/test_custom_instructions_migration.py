@@ -0,0 +1,87 @@
+import importlib
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+sys.path.append(str(APP_DIR))
+
+migration = importlib.import_module("migrations.versions.75bb67fb55db_migrate_custom_instructions")
+
+
+class FakeBind:
+    def __init__(self, ids: list[int]) -> None:
+        self.ids = ids
+        self.updates: list[tuple[str, dict[str, int | str]]] = []
+
+    def execute(self, statement, params):
+        sql = str(statement)
+        if sql.startswith("SELECT id FROM settings"):
+            last = params.get("last", float("-inf"))
+            batch = [row_id for row_id in self.ids if row_id > last][: params["limit"]]
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: batch))
+        self.updates.append((sql, params))
+        return None
+
+
+def online_context() -> MagicMock:
+    context = MagicMock(as_sql=False)
+    context.autocommit_block.side_effect = nullcontext
+    return context
+
+
+def test_update_in_batches_commits_one_id_range_at_a_time(monkeypatch) -> None:
+    bind = FakeBind(list(range(1, 6)))
+    monkeypatch.setattr(migration, "UPDATE_BATCH_SIZE", 2)
+
+    with (
+        patch.object(migration.op, "get_context", return_value=online_context()),
+        patch.object(migration.op, "get_bind", return_value=bind),
+    ):
+        migration._update_in_batches(
+            "settings",
+            "settings_data = settings_data - 'globalSystemPrompt'",
+            "settings_data ? 'globalSystemPrompt'",
+        )
+
+    expected_sql = (
+        "UPDATE settings SET settings_data = settings_data - 'globalSystemPrompt' "
+        "WHERE (settings_data ? 'globalSystemPrompt') AND id BETWEEN :first AND :last"
+    )
+    assert bind.updates == [
+        (expected_sql, {"first": 1, "last": 2}),
+        (expected_sql, {"first": 3, "last": 4}),
+        (expected_sql, {"first": 5, "last": 5}),
+    ]
+
+
+def test_upgrade_replaces_every_non_array_system_prompt_with_bound_default(monkeypatch) -> None:
+    bind = FakeBind([1, 2, 3])
+    monkeypatch.setattr(migration, "UPDATE_BATCH_SIZE", 2)
+
+    with (
+        patch.object(migration.op, "get_context", return_value=online_context()),
+        patch.object(migration.op, "get_bind", return_value=bind),
+        patch.object(migration.op, "alter_column") as alter_column,
+    ):
+        migration.upgrade()
+
+    system_prompt_updates = [
+        (sql, params) for sql, params in bind.updates if "systemPrompt}'" in sql
+    ]
+    assert [params for _, params in system_prompt_updates] == [
+        {"system_prompt": migration.default_systemPrompt_json, "first": 1, "last": 2},
+        {"system_prompt": migration.default_systemPrompt_json, "first": 3, "last": 3},
+    ]
+    sql = system_prompt_updates[0][0]
+    assert (
+        "jsonb_typeof(settings_data -> 'models' -> 'systemPrompt') IS DISTINCT FROM 'array'" in sql
+    )
+    assert "Quality Helper" not in sql
+    assert all(sql.startswith("UPDATE settings") for sql, _ in bind.updates)
+
+    (table, column), kwargs = alter_column.call_args
+    assert (table, column) == ("graphs", "custom_instructions")
+    assert kwargs["postgresql_using"] == "'[\"f342a558-5826-45cf-9b08-5f130414a4ab\"]'::json"
@@ -0,0 +1,40 @@
+import importlib
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+sys.path.append(str(APP_DIR))
+
+migration = importlib.import_module("migrations.versions.ed27c2bb90a4_index_foreign_key_columns")
+
+
+def run(step) -> list[str]:
+    statements: list[str] = []
+    context = MagicMock()
+    context.autocommit_block.side_effect = nullcontext
+    with (
+        patch.object(migration.op, "get_context", return_value=context),
+        patch.object(migration.op, "execute", side_effect=statements.append),
+    ):
+        step()
+    return statements
+
+
+def test_upgrade_backfills_workspaces_user_id_index_on_pre_series_databases() -> None:
+    # A database whose workspaces table came from the original fd447b227777 has no
+    # idx_workspaces_user_id; this revision must build it without failing on fresh installs.
+    statements = run(migration.upgrade)
+
+    assert (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_workspaces_user_id ON workspaces (user_id)"
+        in statements
+    )
+
+
+def test_downgrade_leaves_the_workspaces_user_id_index_to_fd447b227777() -> None:
+    statements = run(migration.downgrade)
+
+    assert not any("idx_workspaces_user_id" in sql for sql in statements)
+    assert "DROP INDEX CONCURRENTLY IF EXISTS idx_graphs_workspace_id" in statements
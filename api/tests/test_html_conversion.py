@@ -0,0 +1,128 @@
+import asyncio
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+from services.web import web_extract
+from services.web.html_conversion import HtmlConversionPool
+
+
+def current_thread_name(prefix: str) -> str:
+    return f"{prefix}:{threading.current_thread().name}"
+
+
+class BrokenExecutor(ThreadPoolExecutor):
+    def submit(self, fn, /, *args, **kwargs):
+        future: Future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+
+def test_pool_is_lazy_sized_from_environment_and_closed() -> None:
+    factory_calls: list[dict[str, object]] = []
+
+    def factory(**kwargs):
+        factory_calls.append(kwargs)
+        return ThreadPoolExecutor(**kwargs)
+
+    pool = HtmlConversionPool(
+        executor_factory=factory,
+        env_getter={"LINK_EXTRACTION_HTML_WORKERS": "2"}.get,
+    )
+
+    async def scenario() -> str:
+        result = await pool.run(current_thread_name, "worker")
+        await pool.close()
+        await pool.close()
+        return result
+
+    assert factory_calls == []
+    assert asyncio.run(scenario()).startswith("worker:")
+    assert factory_calls == [{"max_workers": 2}]
+
+
+def test_unavailable_process_pool_falls_back_to_threads() -> None:
+    def unavailable(**kwargs):
+        raise NotImplementedError("no sem_open")
+
+    pool = HtmlConversionPool(executor_factory=unavailable, env_getter=lambda name, default: "")
+
+    result = asyncio.run(pool.run(current_thread_name, "fallback"))
+
+    assert result.startswith("fallback:html-conversion")
+
+
+class UnstartableExecutor(ThreadPoolExecutor):
+    def submit(self, fn, /, *args, **kwargs):
+        raise NotImplementedError("no sem_open")
+
+
+def test_pool_that_fails_on_first_submit_falls_back_to_threads() -> None:
+    created: list[UnstartableExecutor] = []
+
+    def factory(**kwargs):
+        executor = UnstartableExecutor(**kwargs)
+        created.append(executor)
+        return executor
+
+    pool = HtmlConversionPool(executor_factory=factory, env_getter=lambda name, default: "")
+
+    async def scenario() -> tuple[str, str]:
+        return (
+            await pool.run(current_thread_name, "first"),
+            await pool.run(current_thread_name, "second"),
+        )
+
+    first, second = asyncio.run(scenario())
+
+    assert first.startswith("first:html-conversion")
+    assert second.startswith("second:html-conversion")
+    assert len(created) == 1
+
+
+def test_default_pool_spawns_workers_instead_of_forking() -> None:
+    pool = HtmlConversionPool()
+
+    executor = pool._get_executor()
+    try:
+        assert executor._mp_context.get_start_method() == "spawn"
+    finally:
+        executor.shutdown()
+
+
+def test_broken_process_pool_is_recreated_and_work_still_completes() -> None:
+    created: list[BrokenExecutor] = []
+
+    def factory(**kwargs):
+        executor = BrokenExecutor(**kwargs)
+        created.append(executor)
+        return executor
+
+    pool = HtmlConversionPool(executor_factory=factory, env_getter=lambda name, default: "")
+
+    async def scenario() -> tuple[str, str]:
+        return await pool.run(str.upper, "a"), await pool.run(str.upper, "b")
+
+    assert asyncio.run(scenario()) == ("A", "B")
+    assert len(created) == 2
+
+
+def test_page_conversion_runs_in_a_worker_process() -> None:
+    html = "<nav><a href='/next'>Next</a></nav><main><p>" + "useful content " * 100 + "</p></main>"
+    pool = HtmlConversionPool()
+
+    async def scenario():
+        try:
+            return await pool.run(web_extract._convert_html_page, html, "https://example.com/a")
+        finally:
+            await pool.close()
+
+    result = asyncio.run(scenario())
+
+    assert result is not None
+    assert result["navigation_links"] == [{"title": "Next", "url": "https://example.com/next"}]
+    assert "useful content" in result["markdown_content"]
@@ -1,7 +1,9 @@
+import asyncio
 import json
 from types import SimpleNamespace
 
 import pytest
+from services import openrouter as openrouter_module
 from services.openrouter import _process_tool_calls_and_continue
 from services.providers.anthropic_protocol import build_anthropic_messages
 from services.tools.runtime_results import ToolExecutionEnvelope, TransientImageContent
@@ -155,3 +157,61 @@ def test_image_inspection_anthropic_conversion_combines_tool_result_and_image():
         "media_type": "image/jpeg",
         "data": "YWJj",
     }
+
+
+def test_web_tool_calls_in_one_round_run_concurrently_and_keep_call_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    active = 0
+    max_active = 0
+    executed: list[str] = []
+
+    async def web_handler(arguments, req):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(arguments["delay"])
+        active -= 1
+        executed.append(arguments["name"])
+        return {"name": arguments["name"]}
+
+    async def ordinary_handler(arguments, req):
+        executed.append(arguments["name"])
+        return {"name": arguments["name"]}
+
+    monkeypatch.setitem(openrouter_module.TOOL_HANDLERS_BY_NAME, "web_search", web_handler)
+    monkeypatch.setitem(openrouter_module.TOOL_HANDLERS_BY_NAME, "fetch_page_content", web_handler)
+    monkeypatch.setitem(
+        openrouter_module.TOOL_HANDLERS_BY_NAME, "ordinary_test_tool", ordinary_handler
+    )
+    calls = [
+        {
+            "index": index,
+            "id": f"call-{index}",
+            "type": "function",
+            "function": {"name": name, "arguments": f'{{"name":"{label}","delay":{delay}}}'},
+        }
+        for index, (name, label, delay) in enumerate(
+            [
+                ("web_search", "search", 0.03),
+                ("ordinary_test_tool", "ordinary", 0),
+                ("fetch_page_content", "fetch", 0.01),
+            ]
+        )
+    ]
+    req = SimpleNamespace(graph_id=None, node_id=None, user_id="user", messages=[])
+
+    result = asyncio.run(_process_tool_calls_and_continue(calls, [], req, None))
+
+    assert max_active == 2
+    assert executed == ["fetch", "search", "ordinary"]
+    assert [message.get("name") for message in result.messages[1:]] == [
+        "web_search",
+        "ordinary_test_tool",
+        "fetch_page_content",
+    ]
+    assert [message["tool_call_id"] for message in result.messages[1:]] == [
+        "call-0",
+        "call-1",
+        "call-2",
+    ]
@@ -0,0 +1,105 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+from services.web.page_cache import PageExtractionCache
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, dict] = {}
+        self.gets = 0
+
+    async def get_page_extraction(self, url_hash: str):
+        self.gets += 1
+        return self.values.get(url_hash)
+
+    async def set_page_extraction(self, url_hash: str, extraction: dict) -> None:
+        self.values[url_hash] = extraction
+
+
+def page(markdown: str) -> dict:
+    return {"markdown_content": markdown, "navigation_links": []}
+
+
+def test_cache_is_inactive_until_started() -> None:
+    redis = FakeRedis()
+    cache = PageExtractionCache()
+
+    async def scenario():
+        await cache.set("https://example.com", page("# Page"))
+        return await cache.get("https://example.com")
+
+    assert asyncio.run(scenario()) is None
+    assert redis.values == {}
+
+
+def test_memory_tier_serves_hits_and_evicts_least_recently_used() -> None:
+    redis = FakeRedis()
+    cache = PageExtractionCache(max_entries=2)
+    cache.start(redis)
+
+    async def scenario():
+        await cache.set("https://a.example", page("# A"))
+        await cache.set("https://b.example", page("# B"))
+        assert await cache.get("https://a.example") == page("# A")
+        await cache.set("https://c.example", page("# C"))
+        assert redis.gets == 0
+        assert await cache.get("https://b.example") == page("# B")
+
+    asyncio.run(scenario())
+
+    assert redis.gets == 1
+
+
+def test_expired_memory_entries_fall_back_to_redis() -> None:
+    now = [0.0]
+    redis = FakeRedis()
+    cache = PageExtractionCache(ttl_seconds=10, clock=lambda: now[0])
+    cache.start(redis)
+
+    async def scenario():
+        await cache.set("https://example.com", page("# Page"))
+        now[0] = 11.0
+        return await cache.get("https://example.com")
+
+    assert asyncio.run(scenario()) == page("# Page")
+    assert redis.gets == 1
+
+
+def test_invalid_redis_payloads_are_ignored_and_close_clears_memory() -> None:
+    redis = FakeRedis()
+    cache = PageExtractionCache()
+    cache.start(redis)
+
+    async def scenario():
+        await cache.set("https://example.com", page("# Page"))
+        redis.values = {key: {"markdown_content": 1} for key in redis.values}
+        cache.close()
+        cache.start(redis)
+        return await cache.get("https://example.com")
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_memory_hits_do_not_share_navigation_links_with_callers() -> None:
+    cache = PageExtractionCache()
+    cache.start(FakeRedis())
+    stored = {
+        "markdown_content": "# Page",
+        "navigation_links": [{"title": "Next", "url": "https://example.com/next"}],
+    }
+
+    async def scenario():
+        await cache.set("https://example.com", stored)
+        stored["navigation_links"][0]["title"] = "Mutated by producer"
+        first = await cache.get("https://example.com")
+        first["navigation_links"][0]["title"] = "Mutated by caller"
+        first["navigation_links"].append({"title": "Extra", "url": "https://example.com/x"})
+        return await cache.get("https://example.com")
+
+    assert asyncio.run(scenario())["navigation_links"] == [
+        {"title": "Next", "url": "https://example.com/next"}
+    ]
@@ -1,14 +1,23 @@
 import asyncio
+import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
 
-from const.settings import DEFAULT_SETTINGS
+from const.settings import DEFAULT_ROUTE_GROUP, DEFAULT_SETTINGS
 from models.message import NodeTypeEnum
 from models.usersDTO import BlockSettings, SettingsDTO
 from services import settings as settings_service
 
+_ORIGINAL_WORKING_DIRECTORY = Path.cwd()
+os.chdir(Path(__file__).resolve().parents[1] / "app")
+try:
+    from routers import users
+finally:
+    os.chdir(_ORIGINAL_WORKING_DIRECTORY)
+
 
 EXPECTED_WHEELS = {
     "contextInputWheel": [
@@ -124,3 +133,34 @@ def test_get_user_settings_hydrates_stored_legacy_payload(monkeypatch):
     assert block["contextWheel"] == CUSTOM_CONTEXT_WHEEL
     for key in NEW_WHEEL_KEYS:
         assert block[key] == EXPECTED_WHEELS[key]
+
+
+def test_get_user_settings_does_not_mutate_shared_defaults(monkeypatch):
+    async def fake_get_settings(pg_engine, user_id):
+        return {}
+
+    monkeypatch.setattr(settings_service, "get_settings", fake_get_settings)
+    default_prompts = [prompt.model_copy() for prompt in DEFAULT_SETTINGS.models.systemPrompt]
+
+    settings = asyncio.run(settings_service.get_user_settings(object(), "new-user"))
+
+    assert settings is not DEFAULT_SETTINGS
+    assert settings.models is not DEFAULT_SETTINGS.models
+    assert DEFAULT_SETTINGS.models.systemPrompt == default_prompts
+    assert settings.block == DEFAULT_SETTINGS.block
+
+
+def test_get_user_settings_route_leaves_shared_defaults_untouched(monkeypatch):
+    async def fake_get_settings(pg_engine, user_id):
+        return {}
+
+    monkeypatch.setattr(settings_service, "get_settings", fake_get_settings)
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(pg_engine="engine")))
+    defaults_before = DEFAULT_SETTINGS.model_dump()
+
+    first = asyncio.run(users.req_get_user_settings(request, "new-user"))
+    second = asyncio.run(users.req_get_user_settings(request, "new-user"))
+
+    assert DEFAULT_SETTINGS.model_dump() == defaults_before
+    assert first.blockRouting.routeGroups == second.blockRouting.routeGroups
+    assert first.blockRouting.routeGroups[0] == DEFAULT_ROUTE_GROUP
@@ -6,7 +6,7 @@ import pytest
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
 
-from services.web import reddit, web_extract
+from services.web import http_fetch, reddit, web_extract
 
 
 OLD_REDDIT_HTML = """
@@ -58,11 +58,8 @@ OLD_REDDIT_HTML = """
 
 
 class FakeSession:
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc_value, traceback):
-        return False
+    async def close(self) -> None:
+        return None
 
 
 class FakeBrowserManager:
@@ -125,7 +122,11 @@ def test_reddit_browser_fallback_retains_old_reddit_content(
             403,
         )
 
-    monkeypatch.setattr(web_extract, "AsyncSession", FakeSession)
+    monkeypatch.setattr(
+        web_extract,
+        "fetch_session_manager",
+        http_fetch.FetchSessionManager(session_factory=FakeSession),
+    )
     monkeypatch.setattr(web_extract, "proxy_manager", UnexpectedProxyManager())
     monkeypatch.setattr(web_extract, "browser_fetch_manager", browser)
     monkeypatch.setattr(web_extract, "fetch_http_once", fake_fetch)
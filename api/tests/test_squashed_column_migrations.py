@@ -0,0 +1,41 @@
+import importlib
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+sys.path.append(str(APP_DIR))
+
+migration = importlib.import_module(
+    "migrations.versions.8969e73ef9b7_add_temporary_column_to_graph"
+)
+stubs = [
+    importlib.import_module("migrations.versions.700e47459df6_add_pinned_column_to_graph_table"),
+    importlib.import_module("migrations.versions.3819a2743c6d_add_plan_type_column"),
+]
+
+
+def run(step) -> list[str]:
+    statements: list[str] = []
+    with patch.object(migration.op, "execute", side_effect=statements.append):
+        step()
+    return statements
+
+
+def test_squashed_columns_are_added_with_one_alter_table_per_table() -> None:
+    assert run(migration.upgrade) == [
+        "ALTER TABLE graphs ADD COLUMN IF NOT EXISTS temporary BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN IF NOT EXISTS pinned BOOLEAN NOT NULL DEFAULT false",
+        "ALTER TABLE users ADD COLUMN IF NOT EXISTS plan_type VARCHAR NOT NULL DEFAULT 'free', "
+        "ADD COLUMN IF NOT EXISTS is_admin BOOLEAN NOT NULL DEFAULT false",
+    ]
+
+
+def test_squashed_columns_are_dropped_only_below_the_oldest_stub() -> None:
+    for stub in stubs:
+        assert run(stub.downgrade) == []
+
+    assert run(migration.downgrade) == [
+        "ALTER TABLE users DROP COLUMN IF EXISTS plan_type, DROP COLUMN IF EXISTS is_admin",
+        "ALTER TABLE graphs DROP COLUMN IF EXISTS temporary, DROP COLUMN IF EXISTS pinned",
+    ]
@@ -7,7 +7,7 @@ import pytest
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
 
-from services.web import web_extract
+from services.web import http_fetch, web_extract
 from services.web.browser_fetch import BrowserFetchError
 from services.web.fetch_errors import LinkExtractionError, LinkExtractionFailureReason
 
@@ -45,6 +45,76 @@ def test_convert_to_markdown_preserves_anchor_text_and_destination() -> None:
     assert "[next page](https://external.example/next)" in result
 
 
+@pytest.mark.parametrize("use_rust_converter", [True, False])
+def test_convert_to_markdown_output_is_stable_across_converters(
+    monkeypatch: pytest.MonkeyPatch,
+    use_rust_converter: bool,
+) -> None:
+    if use_rust_converter and web_extract.HTMD_OPTIONS is None:
+        pytest.skip("htmd is not installed")
+    if not use_rust_converter:
+        monkeypatch.setattr(web_extract, "HTMD_OPTIONS", None)
+    html = (
+        "<main><h2>Section</h2><p>Intro <img src='a.png' alt='chart'> text</p>"
+        "<ul><li>first</li><li>second</li></ul></main>"
+    )
+
+    result = web_extract.convert_to_markdown(html, "https://example.com/article")
+
+    assert result.startswith("## Section\n\nIntro")
+    assert "* first\n* second" in result
+    assert "a.png" not in result
+
+
+def test_clean_html_keeps_main_content_and_drops_clutter() -> None:
+    html = """
+    <html><body>
+      <nav>Site menu</nav>
+      <main>
+        <!-- tracking comment -->
+        <script>window.tracker = true;</script>
+        <h1>Title</h1>
+        <div><span></span></div>
+        <p>Body <a href="/next">text</a></p>
+        <hr>
+        <footer>Footer links</footer>
+      </main>
+    </body></html>
+    """
+
+    result = web_extract.clean_html(html)
+
+    assert result.startswith("<main>")
+    assert "<h1>Title</h1>" in result
+    assert '<p>Body <a href="/next">text</a></p>' in result
+    assert "<hr>" in result
+    for omitted in ("Site menu", "tracking comment", "window.tracker", "<span>", "Footer links"):
+        assert omitted not in result
+
+
+def test_clean_html_removes_nested_clutter_and_comments_inside_empty_tags() -> None:
+    html = (
+        "<main><header><nav><script>menu()</script>Menu</nav></header>"
+        "<aside><form><iframe></iframe></form></aside>"
+        "<p><!-- only a comment --></p><p>Kept paragraph</p></main>"
+    )
+
+    result = web_extract.clean_html(html)
+
+    assert result == "<main><p>Kept paragraph</p></main>"
+
+
+def test_clean_html_cascades_empty_parent_removal_in_one_pass() -> None:
+    html = (
+        "<main><div><section><span> </span><em></em></section></div>"
+        "<div><p><img src='a.png'></p></div><p>Text</p></main>"
+    )
+
+    result = web_extract.clean_html(html)
+
+    assert result == '<main><div><p><img src="a.png"></p></div><p>Text</p></main>'
+
+
 def test_extract_navigation_links_filters_normalizes_and_preserves_source_order() -> None:
     html = """
     <body>
@@ -122,6 +192,159 @@ def test_url_to_markdown_remains_a_string_compatibility_wrapper(
     assert isinstance(result, str)
 
 
+def test_concurrent_extractions_for_same_url_share_one_fetch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    async def slow_extraction(url: str) -> web_extract.PageExtractionResult:
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return {"markdown_content": f"# {url}", "navigation_links": []}
+
+    monkeypatch.setattr(web_extract, "_extract_web_page", slow_extraction)
+
+    async def scenario():
+        first = await asyncio.gather(
+            web_extract.extract_web_page("https://example.com/a"),
+            web_extract.extract_web_page("https://example.com/a"),
+            web_extract.extract_web_page("https://example.com/b"),
+        )
+        second = await web_extract.extract_web_page("https://example.com/a")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert [result["markdown_content"] for result in first] == [
+        "# https://example.com/a",
+        "# https://example.com/a",
+        "# https://example.com/b",
+    ]
+    assert second["markdown_content"] == "# https://example.com/a"
+    assert calls == ["https://example.com/a", "https://example.com/b", "https://example.com/a"]
+    assert web_extract._inflight_extractions == {}
+
+
+class FakePageRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, dict] = {}
+
+    async def get_page_extraction(self, url_hash: str):
+        return self.values.get(url_hash)
+
+    async def set_page_extraction(self, url_hash: str, extraction: dict) -> None:
+        self.values[url_hash] = extraction
+
+
+def test_successful_extractions_are_served_from_the_shared_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis = FakePageRedis()
+    calls: list[str] = []
+
+    async def extraction(url: str) -> web_extract.PageExtractionResult:
+        calls.append(url)
+        return {"markdown_content": "# Cached", "navigation_links": []}
+
+    monkeypatch.setattr(web_extract, "_extract_web_page", extraction)
+    web_extract.page_extraction_cache.start(redis)
+    try:
+        first = asyncio.run(web_extract.extract_web_page("https://example.com/?token=secret"))
+        second = asyncio.run(web_extract.extract_web_page("https://example.com/?token=secret"))
+    finally:
+        web_extract.page_extraction_cache.close()
+
+    assert first == second == {"markdown_content": "# Cached", "navigation_links": []}
+    assert calls == ["https://example.com/?token=secret"]
+    assert len(redis.values) == 1
+    assert "secret" not in next(iter(redis.values))
+
+
+def test_failed_extractions_are_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = FakePageRedis()
+
+    async def failing_extraction(url: str) -> web_extract.PageExtractionResult:
+        raise LinkExtractionError(LinkExtractionFailureReason.UNUSABLE_CONTENT)
+
+    monkeypatch.setattr(web_extract, "_extract_web_page", failing_extraction)
+    web_extract.page_extraction_cache.start(redis)
+    try:
+        with pytest.raises(LinkExtractionError):
+            asyncio.run(web_extract.extract_web_page("https://example.com"))
+    finally:
+        web_extract.page_extraction_cache.close()
+
+    assert redis.values == {}
+
+
+def test_shared_extraction_is_cancelled_only_when_every_caller_cancels(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cancelled: list[str] = []
+
+    async def blocked_extraction(url: str) -> web_extract.PageExtractionResult:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return {"markdown_content": "", "navigation_links": []}
+
+    monkeypatch.setattr(web_extract, "_extract_web_page", blocked_extraction)
+
+    async def scenario() -> None:
+        first = asyncio.create_task(web_extract.extract_web_page("https://example.com"))
+        second = asyncio.create_task(web_extract.extract_web_page("https://example.com"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert cancelled == []
+
+        second.cancel()
+        await asyncio.gather(second, return_exceptions=True)
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+
+    assert cancelled == ["https://example.com"]
+    assert web_extract._inflight_extractions == {}
+
+
+def test_caller_arriving_during_cancellation_starts_a_fresh_extraction(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    async def extraction(url: str) -> web_extract.PageExtractionResult:
+        calls.append(url)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                # Winding down the direct and proxy attempts takes a few loop turns
+                await asyncio.sleep(0.01)
+                raise
+        return {"markdown_content": "# Fresh", "navigation_links": []}
+
+    monkeypatch.setattr(web_extract, "_extract_web_page", extraction)
+
+    async def scenario() -> web_extract.PageExtractionResult:
+        abandoned = asyncio.create_task(web_extract.extract_web_page("https://example.com"))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        await asyncio.gather(abandoned, return_exceptions=True)
+
+        return await web_extract.extract_web_page("https://example.com")
+
+    result = asyncio.run(scenario())
+
+    assert result == {"markdown_content": "# Fresh", "navigation_links": []}
+    assert calls == ["https://example.com", "https://example.com"]
+    assert web_extract._inflight_extractions == {}
+
+
 @pytest.mark.parametrize(
     ("raw_url", "expected_fetch_url", "expected_browser_url"),
     [
@@ -308,11 +531,8 @@ VALID_HTML = "<main><h1>Article</h1><p>" + "useful content " * 100 + "</p></main
 
 
 class FakeSession:
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc_value, traceback):
-        return False
+    async def close(self) -> None:
+        return None
 
 
 class FakeProxyManager:
@@ -348,7 +568,11 @@ def configure_orchestration(
     proxies: list[str],
     browser: FakeBrowserManager,
 ) -> None:
-    monkeypatch.setattr(web_extract, "AsyncSession", FakeSession)
+    monkeypatch.setattr(
+        web_extract,
+        "fetch_session_manager",
+        http_fetch.FetchSessionManager(session_factory=FakeSession),
+    )
     monkeypatch.setattr(web_extract, "proxy_manager", FakeProxyManager(proxies))
     monkeypatch.setattr(web_extract, "browser_fetch_manager", browser)
 
@@ -508,11 +732,15 @@ def test_proxy_reddit_structured_fallback_uses_suffix_free_browser_url(
     )
 
     fetch_url = "https://reddit.com/r/Python/comments/abc/title/.JSON/?raw_json=1#comments"
-    assert requested_urls == [("direct", fetch_url), ("http://one:8080", fetch_url)]
+    assert requested_urls == [
+        ("direct", fetch_url),
+        ("http://one:8080", fetch_url),
+        ("http://unused:8080", fetch_url),
+    ]
     assert browser.requested_urls == [
         "https://old.reddit.com/r/Python/comments/abc/title/?raw_json=1#comments"
     ]
-    assert events == ["direct", "http://one:8080", "browser"]
+    assert events == ["direct", "http://one:8080", "http://unused:8080", "browser"]
     assert "# Article" in result
 
 
@@ -645,23 +873,124 @@ def test_transient_failure_rotates_up_to_three_proxies_and_returns_on_success(
     assert events == ["direct", *proxies[:3]]
 
 
-def test_proxy_reddit_style_403_stops_rotation_and_uses_browser_once(
+def test_proxy_attempts_run_concurrently_and_first_success_cancels_the_rest(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    events: list[str] = []
+    cancelled: list[str] = []
+    proxies = ["http://slow:8080", "http://fast:8080", "http://retry:8080"]
+    configure_orchestration(monkeypatch, proxies, FakeBrowserManager(events))
+
+    async def fake_fetch(session: object, url: str, proxy: str | None = None) -> str:
+        events.append(proxy or "direct")
+        if proxy is None or proxy == "http://retry:8080":
+            raise fetch_error(web_extract.FetchDecision.RETRY)
+        if proxy == "http://fast:8080":
+            await asyncio.sleep(0.01)
+            return VALID_HTML
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(proxy)
+            raise
+        return VALID_HTML
+
+    monkeypatch.setattr(web_extract, "fetch_http_once", fake_fetch)
+
+    result = asyncio.run(web_extract.url_to_markdown("https://example.com/article"))
+
+    assert "# Article" in result
+    assert events == ["direct", *proxies]
+    assert cancelled == ["http://slow:8080"]
+
+
+def test_speculative_proxy_success_skips_stalled_direct_fetch(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     events: list[str] = []
+    cancelled: list[str] = []
     configure_orchestration(
-        monkeypatch,
-        ["http://one:8080", "http://two:8080"],
-        FakeBrowserManager(events),
+        monkeypatch, ["http://one:8080", "http://unused:8080"], FakeBrowserManager(events)
     )
 
+    async def fake_fetch(session: object, url: str, proxy: str | None = None) -> str:
+        events.append(proxy or "direct")
+        if proxy is not None:
+            return VALID_HTML
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("direct")
+            raise
+        return VALID_HTML
+
+    monkeypatch.setattr(web_extract, "fetch_http_once", fake_fetch)
+
+    result = asyncio.run(web_extract.url_to_markdown("https://x.com/user/status/1"))
+
+    assert "# Article" in result
+    assert events == ["direct", "http://one:8080"]
+    assert cancelled == ["direct"]
+
+
+def test_speculative_proxy_counts_toward_proxy_attempts_after_direct_retry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    events: list[str] = []
+    browser = FakeBrowserManager(events)
+    proxies = ["http://one:8080", "http://two:8080", "http://three:8080", "http://four:8080"]
+    configure_orchestration(monkeypatch, proxies, browser)
+
+    async def fake_fetch(session: object, url: str, proxy: str | None = None) -> str:
+        events.append(proxy or "direct")
+        raise fetch_error(web_extract.FetchDecision.RETRY)
+
+    monkeypatch.setattr(web_extract, "fetch_http_once", fake_fetch)
+
+    result = asyncio.run(web_extract.url_to_markdown("https://mobile.twitter.com/user"))
+
+    assert "# Article" in result
+    assert events == ["direct", *proxies[:3], "browser"]
+
+
+def stalled_second_proxy_fetch(
+    events: list[str], cancelled: list[str], terminal_error: web_extract.FetchAttemptError
+):
+    """Fail direct transiently, answer proxy one with ``terminal_error`` and stall proxy two."""
+
     async def fake_fetch(session: object, url: str, proxy: str | None = None) -> str:
         events.append(proxy or "direct")
         if proxy is None:
             raise fetch_error(web_extract.FetchDecision.RETRY)
-        raise fetch_error(web_extract.FetchDecision.BROWSER_FALLBACK, 403)
+        if proxy == "http://one:8080":
+            raise terminal_error
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(proxy)
+            raise
+        return VALID_HTML
 
-    monkeypatch.setattr(web_extract, "fetch_http_once", fake_fetch)
+    return fake_fetch
+
+
+def test_proxy_reddit_style_403_cancels_remaining_proxies_and_uses_browser_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    events: list[str] = []
+    cancelled: list[str] = []
+    configure_orchestration(
+        monkeypatch,
+        ["http://one:8080", "http://two:8080"],
+        FakeBrowserManager(events),
+    )
+    monkeypatch.setattr(
+        web_extract,
+        "fetch_http_once",
+        stalled_second_proxy_fetch(
+            events, cancelled, fetch_error(web_extract.FetchDecision.BROWSER_FALLBACK, 403)
+        ),
+    )
 
     result = asyncio.run(
         web_extract.url_to_markdown(
@@ -670,56 +999,60 @@ def test_proxy_reddit_style_403_stops_rotation_and_uses_browser_once(
     )
 
     assert result is not None
-    assert events == ["direct", "http://one:8080", "browser"]
+    assert events == ["direct", "http://one:8080", "http://two:8080", "browser"]
+    assert cancelled == ["http://two:8080"]
 
 
-def test_proxy_evidence_backed_401_stops_rotation_and_uses_browser_once(
+def test_proxy_evidence_backed_401_cancels_remaining_proxies_and_uses_browser_once(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     events: list[str] = []
+    cancelled: list[str] = []
     configure_orchestration(
         monkeypatch,
         ["http://one:8080", "http://two:8080"],
         FakeBrowserManager(events),
     )
-
-    async def fake_fetch(session: object, url: str, proxy: str | None = None) -> str:
-        events.append(proxy or "direct")
-        if proxy is None:
-            raise fetch_error(web_extract.FetchDecision.RETRY)
-        raise fetch_error(web_extract.FetchDecision.BROWSER_FALLBACK, 401)
-
-    monkeypatch.setattr(web_extract, "fetch_http_once", fake_fetch)
+    monkeypatch.setattr(
+        web_extract,
+        "fetch_http_once",
+        stalled_second_proxy_fetch(
+            events, cancelled, fetch_error(web_extract.FetchDecision.BROWSER_FALLBACK, 401)
+        ),
+    )
 
     result = asyncio.run(web_extract.url_to_markdown("https://example.com/challenged"))
 
     assert result is not None
-    assert events == ["direct", "http://one:8080", "browser"]
+    assert events == ["direct", "http://one:8080", "http://two:8080", "browser"]
+    assert cancelled == ["http://two:8080"]
 
 
-def test_proxy_ordinary_401_stops_immediately(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_proxy_ordinary_401_stops_and_cancels_remaining_proxies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     events: list[str] = []
+    cancelled: list[str] = []
     configure_orchestration(
         monkeypatch,
         ["http://one:8080", "http://two:8080"],
         FakeBrowserManager(events),
     )
-
-    async def fake_fetch(session: object, url: str, proxy: str | None = None) -> str:
-        events.append(proxy or "direct")
-        decision = (
-            web_extract.FetchDecision.RETRY if proxy is None else web_extract.FetchDecision.STOP
-        )
-        raise fetch_error(decision, 401 if proxy is not None else None)
-
-    monkeypatch.setattr(web_extract, "fetch_http_once", fake_fetch)
+    monkeypatch.setattr(
+        web_extract,
+        "fetch_http_once",
+        stalled_second_proxy_fetch(
+            events, cancelled, fetch_error(web_extract.FetchDecision.STOP, 401)
+        ),
+    )
 
     with pytest.raises(LinkExtractionError) as captured:
         asyncio.run(web_extract.url_to_markdown("https://example.com/article"))
 
     assert captured.value.reason is LinkExtractionFailureReason.HTTP_REJECTED
     assert captured.value.status_code == 401
-    assert events == ["direct", "http://one:8080"]
+    assert events == ["direct", "http://one:8080", "http://two:8080"]
+    assert cancelled == ["http://two:8080"]
 
 
 @pytest.mark.parametrize("proxies", [[], ["http://one:8080", "http://two:8080"]])
@@ -913,6 +1246,33 @@ def test_preprocess_arxiv_still_returns_local_markdown(
     assert is_direct is True
 
 
+@pytest.mark.parametrize(
+    ("url", "expected_pdf_urls"),
+    [
+        ("https://arxiv.org/abs/1234.5678?download=1#page=2", ["https://arxiv.org/pdf/1234.5678"]),
+        ("www.arxiv.org/abs/1234.5678/", ["https://arxiv.org/pdf/1234.5678"]),
+        ("https://example.com/mirror/arxiv.org/abs/1234.5678", []),
+    ],
+)
+def test_preprocess_dispatches_arxiv_by_host(
+    monkeypatch: pytest.MonkeyPatch,
+    url: str,
+    expected_pdf_urls: list[str],
+) -> None:
+    pdf_urls: list[str] = []
+
+    def fake_arxiv_to_md(pdf_url: str, temp_dir: str) -> str:
+        pdf_urls.append(pdf_url)
+        return "# Local paper"
+
+    monkeypatch.setattr(web_extract, "arxiv_to_md", fake_arxiv_to_md)
+
+    _, is_direct = asyncio.run(web_extract._preprocess_url(url))
+
+    assert pdf_urls == expected_pdf_urls
+    assert is_direct is bool(expected_pdf_urls)
+
+
 def test_failed_arxiv_preprocessing_keeps_fetch_and_browser_url(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
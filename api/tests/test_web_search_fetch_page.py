@@ -2,7 +2,9 @@ import asyncio
 import logging
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
+import httpx
 import pytest
 from fastapi import HTTPException
 
@@ -314,3 +316,102 @@ def test_unexpected_failure_returns_and_reports_only_controlled_data(
     assert "target-user" not in captured
     assert "target-password" not in captured
     assert sentry_messages == ["Unexpected link extraction failure"]
+
+
+def test_filter_and_rank_results_drops_ignored_and_promotes_preferred_sites() -> None:
+    results = [
+        {"title": "Other", "url": "https://other.example/a"},
+        {"title": "Ignored", "url": "https://www.ignored.example/b"},
+        {"title": "Preferred", "url": "https://www.preferred.example/c"},
+        {"title": "Other again", "url": "https://other.example/d"},
+    ]
+
+    ranked = web_search._filter_and_rank_results(
+        results, ["ignored.example"], ["preferred.example"]
+    )
+
+    assert [result["title"] for result in ranked] == ["Preferred", "Other", "Other again"]
+
+
+def test_merge_results_rrf_fuses_rankings_and_deduplicates_urls() -> None:
+    searxng = [
+        {"title": "A", "url": "https://www.a.example/page/"},
+        {"title": "B", "url": "https://b.example/"},
+        {"title": "C", "url": "https://c.example/?id=1"},
+    ]
+    google = [
+        {"title": "C google", "url": "https://c.example/?id=1"},
+        {"title": "A google", "url": "https://A.example/page"},
+        {"title": "D", "url": "https://c.example/?id=2"},
+    ]
+
+    merged = web_search._merge_results_rrf([searxng, google])
+
+    assert [result["title"] for result in merged] == ["A", "C", "B", "D"]
+
+
+def test_search_web_queries_both_backends_concurrently_when_configured(
+    monkeypatch: pytest.MonkeyPatch,
+    boundary_fakes: tuple[list[FakeSpan], list[str]],
+) -> None:
+    active = 0
+    max_active = 0
+
+    async def backend(results):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return results
+
+    async def search_searxng(**kwargs):
+        return await backend(
+            [
+                {"title": "S1", "url": "https://s1.example"},
+                {"title": "Both", "url": "https://x.example"},
+            ]
+        )
+
+    async def search_google_custom(**kwargs):
+        assert kwargs["api_key"] == "server-key"
+        return await backend([{"title": "Both google", "url": "https://x.example/"}])
+
+    monkeypatch.setenv("GOOGLE_SEARCH_API_KEY", "server-key")
+    monkeypatch.setenv("GOOGLE_CSE_ID", "cse-id")
+    monkeypatch.setattr(web_search, "search_searxng", search_searxng)
+    monkeypatch.setattr(web_search, "search_google_custom", search_google_custom)
+    config = SimpleNamespace(
+        tools_web_search_force_custom_api_key=False,
+        tools_web_search_custom_api_key=None,
+        tools_web_search_num_results=5,
+        tools_web_search_ignored_sites=[],
+        tools_web_search_preferred_sites=[],
+    )
+
+    results = asyncio.run(web_search.search_web("query", "all", "all", config, "user-id", object()))
+
+    assert max_active == 2
+    assert [result["title"] for result in results] == ["Both", "S1"]
+
+
+def test_search_searxng_parses_raw_json_body(
+    boundary_fakes: tuple[list[FakeSpan], list[str]],
+) -> None:
+    body = (
+        '{"results": [{"title": "Caf\\u00e9", "url": "https://a.example", "content": "x"},'
+        ' {"title": "B", "url": "https://b.example"}]}'
+    ).encode()
+    requests: list[dict[str, object]] = []
+
+    class FakeClient:
+        async def get(self, url, **kwargs):
+            requests.append({"url": url, **kwargs})
+            return httpx.Response(200, content=body, request=httpx.Request("GET", url))
+
+    results = asyncio.run(
+        web_search.search_searxng("query", "all", "all", 1, [], [], http_client=FakeClient())
+    )
+
+    assert requests[0]["params"]["q"] == "query"
+    assert results == [{"title": "Café", "url": "https://a.example", "content": "x"}]
@@ -230,7 +230,7 @@ def test_web_search_batch_is_serial_ordered_and_preserves_duplicates_and_options
     assert "error" not in result
 
 
-def test_fetch_batch_is_serial_ordered_and_applies_page_limit_per_duplicate(
+def test_fetch_batch_is_concurrent_ordered_and_applies_page_limit_per_duplicate(
     monkeypatch: pytest.MonkeyPatch, req: SimpleNamespace
 ) -> None:
     active = 0
@@ -240,20 +240,22 @@ def test_fetch_batch_is_serial_ordered_and_applies_page_limit_per_duplicate(
     async def fetch_page(**kwargs):
         nonlocal active, max_active
         calls.append(kwargs)
+        call_number = len(calls)
         active += 1
         max_active = max(max_active, active)
-        await asyncio.sleep(0)
+        # Later URLs finish first; results must still follow input order.
+        await asyncio.sleep(0.01 * (10 - call_number))
         active -= 1
-        return {"markdown_content": f"{kwargs['url']} call {len(calls)}"}
+        return {"markdown_content": f"{kwargs['url']} call {call_number}"}
 
     monkeypatch.setattr(web_tools, "fetch_page", fetch_page)
-    urls = ["https://one", "https://one", "https://two"]
+    urls = ["https://one", "https://one", "https://two", "https://three", "https://four"]
 
     result = asyncio.run(web_tools.fetch_page_content({"urls": urls}, req))
 
     assert [call["url"] for call in calls] == urls
     assert all(call["max_length"] == 1234 for call in calls)
-    assert max_active == 1
+    assert max_active == web_tools.MAX_CONCURRENT_PAGE_FETCHES
     assert result == {
         "pages": [
             {
@@ -446,6 +448,16 @@ def test_quality_helper_requires_claim_adjacent_web_source_citations() -> None:
     assert "bare URLs or a detached, bare-URL-only source list" in QUALITY_HELPER_PROMPT
 
 
+def test_openrouter_tool_lists_are_reused_but_returned_as_fresh_lists() -> None:
+    first = registry.get_openrouter_tools([ToolEnum.WEB_SEARCH, ToolEnum.LINK_EXTRACTION])
+    first.append({"type": "function", "function": {"name": "caller_only"}})
+    second = registry.get_openrouter_tools([ToolEnum.WEB_SEARCH, ToolEnum.LINK_EXTRACTION])
+
+    assert [tool["function"]["name"] for tool in second] == ["web_search", "fetch_page_content"]
+    assert second[0] is web_tools.WEB_SEARCH_TOOL
+    assert second[1] is web_tools.FETCH_PAGE_CONTENT_TOOL
+
+
 def test_plural_array_bounds_survive_representative_schema_adapters(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
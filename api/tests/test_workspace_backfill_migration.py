@@ -0,0 +1,78 @@
+import importlib
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+sys.path.append(str(APP_DIR))
+
+migration = importlib.import_module("migrations.versions.fd447b227777_add_workspace_table")
+
+
+class FakeBind:
+    def __init__(self, user_ids: list[int]) -> None:
+        self.user_ids = user_ids
+        self.updates: list[dict[str, int] | str] = []
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        if sql.startswith("SELECT id FROM users"):
+            last = params.get("last", float("-inf"))
+            batch = [user_id for user_id in self.user_ids if user_id > last][: params["limit"]]
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: batch))
+        assert "t.workspace_id IS NULL" in sql
+        if params is None:
+            self.updates.append("sweep")
+        else:
+            assert "FOR UPDATE SKIP LOCKED" in sql
+            self.updates.append(params)
+        return None
+
+
+def test_workspace_backfill_updates_owners_in_keyset_batches_then_sweeps(monkeypatch) -> None:
+    bind = FakeBind(list(range(1, 8)))
+    monkeypatch.setattr(migration, "BACKFILL_BATCH_SIZE", 3)
+
+    with (
+        patch.object(migration.op, "get_context", return_value=MagicMock(as_sql=False)),
+        patch.object(migration.op, "get_bind", return_value=bind),
+    ):
+        migration._backfill_workspace_ids("graphs")
+
+    assert bind.updates == [
+        {"first": 1, "last": 3},
+        {"first": 4, "last": 6},
+        {"first": 7, "last": 7},
+        "sweep",
+    ]
+
+
+class FakeInsertBind:
+    def __init__(self, user_ids: list[int]) -> None:
+        self.user_ids = user_ids
+        self.batches: list[list[int]] = []
+
+    def execute(self, statement, params):
+        sql = str(statement)
+        assert sql.lstrip().startswith("INSERT INTO workspaces (user_id, name)")
+        # Users that already got a workspace in an interrupted run are skipped on resume
+        assert "WHERE NOT EXISTS (SELECT 1 FROM workspaces w WHERE w.user_id = users.id)" in sql
+        last = params.get("last", float("-inf"))
+        batch = [user_id for user_id in self.user_ids if user_id > last][: params["limit"]]
+        self.batches.append(batch)
+        returned = list(reversed(batch))
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: returned))
+
+
+def test_default_workspaces_are_inserted_in_keyset_batches(monkeypatch) -> None:
+    bind = FakeInsertBind(list(range(1, 6)))
+    monkeypatch.setattr(migration, "WORKSPACE_INSERT_BATCH_SIZE", 2)
+
+    with (
+        patch.object(migration.op, "get_context", return_value=MagicMock(as_sql=False)),
+        patch.object(migration.op, "get_bind", return_value=bind),
+    ):
+        migration._insert_default_workspaces()
+
+    assert bind.batches == [[1, 2], [3, 4], [5], []]